@@ -1,17 +1,31 @@
-import importlib
+import json
+import time
+from contextlib import nullcontext
 from pathlib import Path
+from typing import Any
 
 import typer
 from dotenv import load_dotenv
-from pyinstrument import Profiler
 from rich import print
+from rich.table import Table
 from typing_extensions import Annotated
 
+# Modules only used by some commands are imported by these commands, so
+# the startup of the CLI stays fast (see --startup-report)
+from scripts.profilers import ProfilerBackend
 from scripts.utils import (
+    DAEMON_SOCKET_PATH,
+    DAYS_PATH,
     AnswerResult,
     DataType,
+    Engine,
+    SolverTimeoutError,
     create_empty_file,
+    fetch_inputs,
+    get_available_days,
+    get_available_engines,
     get_input,
+    get_puzzle_solver_class,
     submit_answer,
 )
 
@@ -19,6 +33,44 @@ load_dotenv()
 app = typer.Typer()
 
 
+@app.callback(invoke_without_command=True)
+def main(
+    ctx: typer.Context,
+    startup_report: Annotated[
+        bool,
+        typer.Option(help="Display the import time of each package and exit"),
+    ] = False,
+):
+    """
+    Advent of Code 2015 solutions.
+    """
+    if startup_report:
+        from scripts.startup import get_import_times
+
+        import_times = get_import_times()
+        total_time = sum(import_times.values())
+
+        table = Table(title="Import time of aoc.py (fresh interpreter)")
+        table.add_column("Package")
+        table.add_column("Import time", justify="right")
+        table.add_column("Share", justify="right")
+        for package, import_time in import_times.items():
+            table.add_row(
+                package,
+                f"{import_time / 1000:.3f}ms",
+                f"{import_time / total_time:.1%}",
+            )
+        print(table)
+        print(
+            f"[green]Total import time : [bold]{total_time / 1000:.3f}ms[/bold][/green]"
+        )
+        raise typer.Exit()
+
+    if ctx.invoked_subcommand is None:
+        print(ctx.get_help())
+        raise typer.Exit()
+
+
 @app.command()
 def run(
     day: Annotated[
@@ -31,31 +83,158 @@ def run(
             help="Data type: 'input' for user data, or 'example' for example data",
         ),
     ] = DataType.INPUT,
-    benchmark: Annotated[
-        bool, typer.Option(help="Activate benchmark mode is specified")
-    ] = False,
+    engine: Annotated[
+        Engine, typer.Option(help="Implementation of the solution to use")
+    ] = Engine.REFERENCE,
+    difficulties: Annotated[
+        tuple[int, int] | None,
+        typer.Option(
+            help="Leading zeros of hashes of both parts, for day 4 (ex: 7 8)",
+            show_default=False,
+        ),
+    ] = None,
+    deliverers: Annotated[
+        int | None,
+        typer.Option(
+            help="Number of deliverers taking turns in second part, for day 3",
+            min=1,
+            show_default=False,
+        ),
+    ] = None,
+    profiler: Annotated[
+        ProfilerBackend | None,
+        typer.Option(help="Profile each stage and write profiles in files"),
+    ] = None,
+    profile_dir: Annotated[
+        Path | None,
+        typer.Option(help="Directory of profile files (profiles/dayXX by default)"),
+    ] = None,
     submit: Annotated[
         bool, typer.Option(help="Submit the solution on AoC (AOC_SESSION_ID needed)")
     ] = False,
+    cache: Annotated[
+        bool, typer.Option(help="Use results cached for unchanged data and solver")
+    ] = True,
+    parallel_parts: Annotated[
+        bool | None,
+        typer.Option(
+            help="Solve both parts in separate processes (solver default if not set)",
+            show_default=False,
+        ),
+    ] = None,
+    instrument: Annotated[
+        bool,
+        typer.Option(help="Measure time, memory and GC collections of each stage"),
+    ] = False,
+    memory: Annotated[
+        bool, typer.Option(help="Report the top allocation sites of each stage")
+    ] = False,
+    memory_diff: Annotated[
+        bool,
+        typer.Option(help="With --memory, compare allocations of both parts"),
+    ] = False,
+    memory_top: Annotated[
+        int, typer.Option(min=1, help="Number of allocation sites to report")
+    ] = 10,
+    progress: Annotated[
+        bool, typer.Option(help="Display the live progress of long-running searches")
+    ] = False,
+    timeout: Annotated[
+        float | None,
+        typer.Option(min=0, help="Cancel the run after this number of seconds"),
+    ] = None,
+    resume: Annotated[
+        bool, typer.Option(help="Resume long-running searches from their checkpoint")
+    ] = False,
+    checkpoint_every: Annotated[
+        float,
+        typer.Option(
+            min=0, help="Seconds between checkpoints of long-running searches"
+        ),
+    ] = 10.0,
+    inputs_dir: Annotated[
+        Path | None,
+        typer.Option(
+            exists=True, file_okay=False, help="Solve every input file of a directory"
+        ),
+    ] = None,
+    inputs_glob: Annotated[
+        str, typer.Option(help="Pattern of input files to solve in --inputs-dir")
+    ] = "*.txt",
+    workers: Annotated[
+        int | None,
+        typer.Option(
+            min=1,
+            help="Number of worker processes for --inputs-dir (CPU count by default)",
+        ),
+    ] = None,
 ):
     """
     Run the solution for a given day.
 
-    If --benchmark is used, pyinstrument will profile the process.
+    If --inputs-dir is used, every matching file is solved on a process pool, and results
+    are written as JSON lines as soon as they're available.
+
+    If --profiler is used, each stage is profiled separately (cache is ignored).
+
+    If --instrument is used, each stage is measured in the same process (cache is ignored).
+
+    If --memory is used, allocation sites are reported at the memory peak and at the end
+    of each stage (cache is ignored).
+
+    If --timeout is used, long-running searches are cancelled once the time is exceeded.
+
+    If --resume is used, long-running searches continue from their last checkpoint (saved
+    for the same data), instead of starting from scratch.
 
     If --submit is used, solution will be submitted on AoC website using your AOC_SESSION_ID.
     """
+    from scripts.cache import ResultCache
+    from scripts.checkpoints import CheckpointStore
+    from scripts.instrumentation import AllocationTracker, Instrumentation
+    from scripts.profilers import get_stage_profiler
+    from scripts.progress import ProgressDisplay
 
-    # Load module of the day
+    # Load puzzle solver of the day
     try:
-        day_module = importlib.import_module(f"days.day{day:02d}.main")
+        puzzle_solver_class = get_puzzle_solver_class(day, engine)
     except ModuleNotFoundError:
-        print(f"[red]No puzzle solver for [bold]day {day}[/bold] yet.[/red]")
+        if engine in get_available_engines(day) or not get_available_engines(day):
+            print(f"[red]No puzzle solver for [bold]day {day}[/bold] yet.[/red]")
+        else:
+            print(f"[red]No {engine.value} engine for [bold]day {day}[/bold].[/red]")
         raise typer.Exit(1)
 
+    # Parameters change the puzzle, which is then solved like any other
+    parameters = {}
+    for name, label, value in (
+        ("difficulties", "Difficulties", difficulties),
+        ("nb_deliverers", "Number of deliverers", deliverers),
+    ):
+        if value is None:
+            continue
+        if name not in puzzle_solver_class.parameters:
+            print(f"[red]{label} can't be set for [bold]day {day}[/bold].[/red]")
+            raise typer.Exit(1)
+        parameters[name] = value
+
+    if inputs_dir is not None:
+        if submit:
+            print("[red]You can't send answers for a directory of inputs[/red]")
+            raise typer.Exit(1)
+        run_inputs_dir(
+            day=day,
+            engine=engine,
+            data_files=sorted(inputs_dir.glob(inputs_glob)),
+            workers=workers,
+            cache=cache,
+            parameters=parameters,
+        )
+        return
+
     # Instanciate puzzle solver
     try:
-        puzzle_solver = day_module.PuzzleSolver(
+        puzzle_solver = puzzle_solver_class(
             day=day,
             data_type=data_type,
         )
@@ -65,22 +244,69 @@ def run(
         )
         raise typer.Exit(1)
 
+    puzzle_solver.set_parameters(parameters)
+
+    if parallel_parts is not None:
+        puzzle_solver.parallel_parts = parallel_parts
+
+    if instrument is True:
+        instrumentation = Instrumentation()
+        puzzle_solver.add_stage_hook(instrumentation)
+
+    if memory is True:
+        allocation_tracker = AllocationTracker(top=memory_top)
+        puzzle_solver.add_stage_hook(allocation_tracker)
+
+    if profiler is not None:
+        print(f"Profiling mode activated with {profiler.value} !")
+        stage_profiler = get_stage_profiler(
+            backend=profiler,
+            output_path=profile_dir or Path("profiles") / f"day{day:02d}",
+        )
+        puzzle_solver.add_stage_hook(stage_profiler)
+
+    progress_display = ProgressDisplay() if progress is True else nullcontext()
+    if progress is True:
+        puzzle_solver.add_progress_hook(progress_display)
+
+    # Measures and progress of parts solved in other processes would be lost
+    if instrument is True or memory is True or profiler is not None or progress:
+        puzzle_solver.parallel_parts = False
+
     print(f"Running puzzle solver for day {day}...")
     if is_example := data_type == DataType.EXAMPLE:
         print("Computing example data...")
 
-    # Execution with benchmark if specified
-    if benchmark is True:
-        print("Benchmark mode activated !")
-        profiler = Profiler()
-        profiler.start()
-        results = puzzle_solver.solve()
-        profiler.stop()
-        print(f"[green]Results : [bold]{results}[/bold][/green]")
-        profiler.print()
-    else:
-        results = puzzle_solver.solve()
-        print(f"[green]Results : [bold]{results}[/bold][/green]")
+    if timeout is not None:
+        puzzle_solver.set_time_budget(timeout)
+
+    puzzle_solver.checkpoint_store = CheckpointStore(
+        resume=resume, every_seconds=checkpoint_every
+    )
+
+    try:
+        with progress_display:
+            if cache is True and not puzzle_solver.stage_hooks:
+                results = ResultCache().solve(puzzle_solver)
+            else:
+                results = puzzle_solver.solve()
+    except SolverTimeoutError as error:
+        print(f"[red]Run cancelled after {timeout}s : {error}[/red]")
+        raise typer.Exit(1)
+    print(f"[green]Results : [bold]{results}[/bold][/green]")
+
+    if instrument is True:
+        print(instrumentation.to_table())
+
+    if memory is True:
+        for table in allocation_tracker.to_tables():
+            print(table)
+        if memory_diff is True:
+            print(allocation_tracker.to_diff_table(*puzzle_solver.stages[1:]))
+
+    if profiler is not None:
+        for output_file in stage_profiler.output_files:
+            print(f"[green]Profile written in [bold]{output_file}[/bold][/green]")
 
     # Stop here if we're not planning to submit anything
     if not submit:
@@ -107,6 +333,592 @@ def run(
                 continue
 
 
+def run_inputs_dir(
+    day: int,
+    engine: Engine,
+    data_files: list[Path],
+    workers: int | None,
+    cache: bool,
+    parameters: dict[str, Any],
+) -> None:
+    from scripts.runner import run_inputs
+
+    if not data_files:
+        print("[red]No input file found.[/red]")
+        raise typer.Exit(1)
+
+    has_errors = False
+    input_runs = run_inputs(
+        day=day,
+        engine=engine,
+        data_files=data_files,
+        max_workers=workers,
+        use_cache=cache,
+        parameters=parameters,
+    )
+    for input_run in input_runs:
+        has_errors |= input_run.error is not None
+        typer.echo(json.dumps(input_run.to_dict()))
+
+    if has_errors:
+        raise typer.Exit(1)
+
+
+@app.command()
+def run_all(
+    days: Annotated[
+        list[int] | None,
+        typer.Argument(help="Days of solutions to run (all available days by default)"),
+    ] = None,
+    data_type: Annotated[
+        DataType,
+        typer.Option(
+            help="Data type: 'input' for user data, or 'example' for example data",
+        ),
+    ] = DataType.INPUT,
+    workers: Annotated[
+        int | None,
+        typer.Option(min=1, help="Number of worker processes (CPU count by default)"),
+    ] = None,
+    cache: Annotated[
+        bool, typer.Option(help="Use results cached for unchanged data and solver")
+    ] = True,
+):
+    """
+    Run the solutions for several days in parallel on a process pool.
+
+    Slowest days (judged from previous runs) are started first.
+    """
+    from scripts.runner import run_days
+
+    days = days or get_available_days()
+    print(f"Running puzzle solvers for {len(days)} days...")
+
+    start_time = time.perf_counter()
+    day_runs = sorted(
+        run_days(days=days, data_type=data_type, max_workers=workers, use_cache=cache),
+        key=lambda day_run: day_run.day,
+    )
+    total_duration = time.perf_counter() - start_time
+
+    table = Table(title=f"Results ({data_type.value})")
+    table.add_column("Day", justify="right")
+    table.add_column("Part 1")
+    table.add_column("Part 2")
+    table.add_column("Wall time", justify="right")
+    for day_run in day_runs:
+        if day_run.error is not None:
+            table.add_row(str(day_run.day), f"[red]{day_run.error}[/red]", "", "")
+            continue
+
+        first_result, second_result = day_run.results
+        table.add_row(
+            str(day_run.day),
+            str(first_result),
+            str(second_result),
+            f"{day_run.duration:.3f}s" + (" (cached)" if day_run.cached else ""),
+        )
+    print(table)
+    print(f"[green]Total wall time : [bold]{total_duration:.3f}s[/bold][/green]")
+
+    if any(day_run.error is not None for day_run in day_runs):
+        raise typer.Exit(1)
+
+
+@app.command()
+def benchmark(
+    days: Annotated[
+        list[int] | None,
+        typer.Argument(
+            help="Days of solutions to benchmark (all available by default)"
+        ),
+    ] = None,
+    data_type: Annotated[
+        DataType,
+        typer.Option(
+            help="Data type: 'input' for user data, or 'example' for example data",
+        ),
+    ] = DataType.INPUT,
+    engine: Annotated[
+        Engine, typer.Option(help="Implementation of the solution to use")
+    ] = Engine.REFERENCE,
+    warmup: Annotated[
+        int, typer.Option(min=1, help="Number of complete solve() calls before timing")
+    ] = 1,
+    repeats: Annotated[
+        int, typer.Option(min=1, help="Number of timed runs for each stage")
+    ] = 10,
+    output: Annotated[
+        Path, typer.Option(help="Path of the JSON report to write")
+    ] = Path("benchmark.json"),
+    baseline: Annotated[
+        Path | None,
+        typer.Option(exists=True, dir_okay=False, help="JSON report to compare with"),
+    ] = None,
+    threshold: Annotated[
+        float,
+        typer.Option(min=0, help="Maximum slowdown (in %) allowed against baseline"),
+    ] = 10.0,
+    trace_memory: Annotated[
+        bool, typer.Option(help="Measure peak memory on an additional run of stages")
+    ] = True,
+    history: Annotated[
+        bool, typer.Option(help="Record results in the performance history")
+    ] = True,
+):
+    """
+    Benchmark parsing and both parts of the solutions, with statistics over several runs.
+
+    If --baseline is used, the command fails when a stage median is slower than
+    the baseline one by more than --threshold percent.
+
+    Results are recorded in the performance history (see history command).
+    """
+    from scripts.benchmark import BenchmarkReport, benchmark_day
+    from scripts.history import HistoryStore
+
+    days = days or get_available_days()
+    report = BenchmarkReport(
+        data_type=data_type, engine=engine, warmup=warmup, repeats=repeats
+    )
+
+    for day in days:
+        print(f"Benchmarking day {day}...")
+        try:
+            report.add(
+                benchmark_day(
+                    day=day,
+                    data_type=data_type,
+                    engine=engine,
+                    warmup=warmup,
+                    repeats=repeats,
+                    trace_memory=trace_memory,
+                )
+            )
+        except ModuleNotFoundError:
+            print(f"[red]No puzzle solver for [bold]day {day}[/bold] yet.[/red]")
+            raise typer.Exit(1)
+        except FileNotFoundError:
+            print(
+                f"[red]File [bold]{data_type.value}.txt[/bold] not found for day {day}.[/red]"
+            )
+            raise typer.Exit(1)
+
+    comparisons = (
+        {
+            (comparison.day, comparison.stage): comparison
+            for comparison in report.compare(baseline)
+        }
+        if baseline
+        else {}
+    )
+
+    table = Table(
+        title=f"Benchmark of {engine.value} engine ({warmup} warm-up, {repeats} repeats)"
+    )
+    for column in (
+        "Day",
+        "Stage",
+        "Min",
+        "Median",
+        "P95",
+        "Peak memory",
+        "Baseline",
+        "Change",
+    ):
+        table.add_column(column, justify="right")
+    for day, day_benchmark in report.days.items():
+        for stage, timing_statistics in day_benchmark.stages.items():
+            peak_memory = day_benchmark.peak_memory.get(stage)
+            row = [
+                str(day),
+                stage.replace("_", " "),
+                f"{timing_statistics.min * 1000:.3f}ms",
+                f"{timing_statistics.median * 1000:.3f}ms",
+                f"{timing_statistics.p95 * 1000:.3f}ms",
+                f"{peak_memory / 1024**2:.3f}MiB" if peak_memory is not None else "-",
+            ]
+            if comparison := comparisons.get((day, stage)):
+                color = "red" if comparison.slowdown * 100 > threshold else "green"
+                row += [
+                    f"{comparison.baseline_median * 1000:.3f}ms",
+                    f"[{color}]{comparison.slowdown:+.1%}[/{color}]",
+                ]
+            table.add_row(*row)
+    print(table)
+
+    if any(day_benchmark.caches for day_benchmark in report.days.values()):
+        caches_table = Table(title="Memoized methods")
+        for column in ("Day", "Method", "Hits", "Misses", "Hit rate"):
+            caches_table.add_column(column, justify="right")
+        for day, day_benchmark in report.days.items():
+            for name, cache_statistics in day_benchmark.caches.items():
+                caches_table.add_row(
+                    str(day),
+                    name,
+                    str(cache_statistics.hits),
+                    str(cache_statistics.misses),
+                    f"{cache_statistics.hit_rate:.1%}",
+                )
+        print(caches_table)
+
+    report.save(output)
+    print(f"[green]Report written in [bold]{output}[/bold][/green]")
+
+    if history is True:
+        with HistoryStore() as history_store:
+            report.record(history_store)
+        print(
+            f"[green]Results recorded in history for commit "
+            f"[bold]{history_store.git_commit}[/bold][/green]"
+        )
+
+    regressions = [
+        comparison
+        for comparison in comparisons.values()
+        if comparison.slowdown * 100 > threshold
+    ]
+    if regressions:
+        print(
+            f"[red]{len(regressions)} stage(s) slower than baseline "
+            f"by more than {threshold}%[/red]"
+        )
+        raise typer.Exit(1)
+
+
+@app.command()
+def history(
+    days: Annotated[
+        list[int] | None,
+        typer.Argument(help="Days to show the history of (all recorded by default)"),
+    ] = None,
+    engine: Annotated[
+        Engine | None, typer.Option(help="Only show benchmarks of this engine")
+    ] = None,
+    last: Annotated[
+        int, typer.Option(min=1, help="Number of last commits to show for each stage")
+    ] = 5,
+    threshold: Annotated[
+        float,
+        typer.Option(min=0, help="Slowdown (in %) against previous commit to flag"),
+    ] = 10.0,
+):
+    """
+    Show the trends of benchmark medians across commits, and flag slowdowns.
+
+    Benchmarks are recorded by the benchmark command.
+    """
+    from scripts.history import HistoryStore, find_slowdowns, get_trends
+
+    with HistoryStore() as history_store:
+        trends = get_trends(history_store.get_benchmarks(days=days, engine=engine))
+    if not trends:
+        print("[yellow]No benchmark recorded yet.[/yellow]")
+        return
+
+    table = Table(title="Performance history")
+    for column in ("Day", "Stage", "Engine", "Commit", "Date", "Median", "Peak memory"):
+        table.add_column(column, justify="right")
+    table.add_column("Change", justify="right")
+    for (day, stage, trend_engine, _, _), points in trends.items():
+        shown_points = points[-last - 1 :]
+        for previous_point, point in zip([None, *shown_points], shown_points):
+            if previous_point is None and len(points) > last:
+                continue  # Only kept to compute the change of the next one
+
+            change = ""
+            if previous_point is not None:
+                ratio = point.median / previous_point.median - 1
+                color = "red" if ratio * 100 > threshold else "green"
+                change = f"[{color}]{ratio:+.1%}[/{color}]"
+            table.add_row(
+                str(day),
+                stage.replace("_", " "),
+                trend_engine,
+                point.git_commit,
+                point.recorded_at,
+                f"{point.median * 1000:.3f}ms",
+                (
+                    f"{point.peak_memory / 1024**2:.3f}MiB"
+                    if point.peak_memory is not None
+                    else "-"
+                ),
+                change,
+            )
+        table.add_section()
+    print(table)
+
+    for slowdown in find_slowdowns(trends, threshold=threshold):
+        print(
+            f"[red]Day {slowdown.day} {slowdown.stage.replace('_', ' ')} "
+            f"({slowdown.engine}) slowed down by {slowdown.ratio:+.1%} in commit "
+            f"[bold]{slowdown.git_commit}[/bold] "
+            f"(previous commit: {slowdown.previous_commit})[/red]"
+        )
+
+
+@app.command()
+def verify(
+    days: Annotated[
+        list[int] | None,
+        typer.Argument(help="Days of solutions to verify (all available by default)"),
+    ] = None,
+    seeds: Annotated[
+        int, typer.Option(min=0, help="Number of generated inputs to verify")
+    ] = 3,
+    size: Annotated[
+        int | None,
+        typer.Option(min=1, help="Size of generated inputs (smallest by default)"),
+    ] = None,
+):
+    """
+    Check that every engine of a day gives the same answers.
+
+    Engines are run on example data, input data and generated inputs.
+    """
+    from scripts.verify import verify_day
+
+    days = [
+        day
+        for day in days or get_available_days()
+        if len(get_available_engines(day)) > 1
+    ]
+    if not days:
+        print("[yellow]No day with several engines to verify.[/yellow]")
+        return
+
+    table = Table(title="Verification of engines")
+    for column in ("Day", "Data", "Engine", "Results", "Status"):
+        table.add_column(column)
+    nb_mismatches = 0
+    for day in days:
+        print(f"Verifying day {day}...")
+        for verification in verify_day(day=day, seeds=seeds, size=size):
+            nb_mismatches += not verification.is_consistent
+            status = (
+                "[green]OK[/green]"
+                if verification.is_consistent
+                else "[red]MISMATCH[/red]"
+            )
+            for engine, results in verification.results.items():
+                table.add_row(
+                    str(day),
+                    verification.data_name,
+                    engine.value,
+                    str(results),
+                    status,
+                )
+            table.add_section()
+    print(table)
+
+    if nb_mismatches:
+        print(f"[red]{nb_mismatches} data file(s) with different answers[/red]")
+        raise typer.Exit(1)
+    print("[green]All engines give the same answers[/green]")
+
+
+@app.command()
+def generate(
+    day: Annotated[
+        int,
+        typer.Argument(
+            min=1, max=26, help="Day of input to generate (ex: 1 for day01)"
+        ),
+    ],
+    size: Annotated[
+        int, typer.Argument(min=1, help="Size of input (meaning depends on the day)")
+    ],
+    output: Annotated[Path, typer.Option(help="Path of the input file to write")],
+    seed: Annotated[int, typer.Option(help="Seed of the random generator")] = 0,
+):
+    """
+    Generate a valid input of a given size for a given day.
+    """
+    from scripts.scaling import write_generated_input
+
+    try:
+        write_generated_input(day=day, size=size, output_file=output, seed=seed)
+    except ModuleNotFoundError:
+        print(f"[red]No input generator for [bold]day {day}[/bold] yet.[/red]")
+        raise typer.Exit(1)
+
+    print(f"[green]Input of size {size} written in [bold]{output}[/bold][/green]")
+
+
+@app.command()
+def scale(
+    days: Annotated[
+        list[int] | None,
+        typer.Argument(help="Days of solutions to scale (all available by default)"),
+    ] = None,
+    sizes: Annotated[
+        list[int] | None,
+        typer.Option(
+            "--size",
+            min=1,
+            help="Input size to solve, can be repeated (generator sizes by default)",
+        ),
+    ] = None,
+    seed: Annotated[int, typer.Option(help="Seed of the random generator")] = 0,
+):
+    """
+    Solve generated inputs of increasing sizes, and fit the growth curve of solving time.
+    """
+    from scripts.scaling import fit_growth_curve, scale_day
+
+    days = days or get_available_days()
+
+    table = Table(title="Scaling of solutions")
+    table.add_column("Day", justify="right")
+    table.add_column("Wall time by size")
+    table.add_column("Growth", justify="right")
+    table.add_column("R²", justify="right")
+    for day in days:
+        print(f"Scaling day {day}...")
+        try:
+            scale_runs = scale_day(day=day, sizes=sizes, seed=seed)
+        except ModuleNotFoundError:
+            print(
+                f"[red]No puzzle solver or generator for [bold]day {day}[/bold].[/red]"
+            )
+            continue
+
+        growth_curve = fit_growth_curve(
+            sizes=[scale_run.size for scale_run in scale_runs],
+            timings=[scale_run.duration for scale_run in scale_runs],
+        )
+        table.add_row(
+            str(day),
+            "\n".join(
+                f"{scale_run.size}: {scale_run.duration:.3f}s"
+                for scale_run in scale_runs
+            ),
+            str(growth_curve) if growth_curve else "-",
+            f"{growth_curve.r_squared:.3f}" if growth_curve else "-",
+        )
+    print(table)
+
+
+@app.command()
+def serve(
+    socket_path: Annotated[
+        Path, typer.Option("--socket", help="Path of the Unix socket to listen on")
+    ] = DAEMON_SOCKET_PATH,
+    workers: Annotated[
+        int | None,
+        typer.Option(min=1, help="Number of worker processes (CPU count by default)"),
+    ] = None,
+):
+    """
+    Serve solve requests on a Unix socket, keeping modules and parsed data warm.
+
+    Requests are JSON lines, as sent by the client command.
+    """
+    from scripts.daemon import SolverServer
+
+    server = SolverServer(socket_path=socket_path, max_workers=workers)
+    print(f"[green]Serving puzzle solvers on [bold]{socket_path}[/bold][/green]")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("Stopping server...")
+    finally:
+        server.server_close()
+
+
+@app.command()
+def client(
+    day: Annotated[
+        int,
+        typer.Argument(min=1, max=26, help="Day of solution to run (ex: 1 for day01)"),
+    ],
+    data_type: Annotated[
+        DataType,
+        typer.Option(
+            help="Data type: 'input' for user data, or 'example' for example data",
+        ),
+    ] = DataType.INPUT,
+    engine: Annotated[
+        Engine, typer.Option(help="Implementation of the solution to use")
+    ] = Engine.REFERENCE,
+    data_file: Annotated[
+        Path | None,
+        typer.Option(exists=True, dir_okay=False, help="Data file to solve instead"),
+    ] = None,
+    cache: Annotated[
+        bool, typer.Option(help="Use results cached for unchanged data and solver")
+    ] = True,
+    socket_path: Annotated[
+        Path, typer.Option("--socket", help="Path of the Unix socket of the server")
+    ] = DAEMON_SOCKET_PATH,
+):
+    """
+    Send a solve request to a running server (see serve command).
+    """
+    from scripts.daemon import send_request
+
+    request = {
+        "day": day,
+        "engine": engine.value,
+        "data_type": data_type.value,
+        "cache": cache,
+    }
+    if data_file is not None:
+        request["data_file"] = str(data_file.resolve())
+
+    try:
+        response = send_request(socket_path=socket_path, request=request)
+    except (FileNotFoundError, ConnectionRefusedError):
+        print(f"[red]No server listening on [bold]{socket_path}[/bold].[/red]")
+        raise typer.Exit(1)
+
+    if "error" in response:
+        print(f"[red]Error for day {day} : {response['error']}[/red]")
+        raise typer.Exit(1)
+
+    print(f"[green]Results : [bold]{tuple(response['results'])}[/bold][/green]")
+
+
+@app.command("fetch-inputs")
+def fetch_missing_inputs(
+    days: Annotated[
+        list[int] | None,
+        typer.Argument(
+            help="Days of inputs to retrieve (all existing days by default)"
+        ),
+    ] = None,
+    connections: Annotated[
+        int, typer.Option(min=1, help="Maximum number of concurrent connections")
+    ] = 8,
+):
+    """
+    Retrieve the missing input.txt files of existing days concurrently from AoC.
+    """
+    days = days or sorted(
+        int(day_path.name[3:]) for day_path in DAYS_PATH.glob("day*/")
+    )
+    missing_days = [
+        day
+        for day in days
+        if (input_file := DAYS_PATH / f"day{day:02d}" / "input.txt").parent.exists()
+        and (not input_file.exists() or input_file.stat().st_size == 0)
+    ]
+    if not missing_days:
+        print("[green]No missing input, nothing to do.[/green]")
+        return
+
+    inputs = fetch_inputs(days=missing_days, max_connections=connections)
+    for day, input_content in inputs.items():
+        if input_content is None:
+            continue
+        input_file_path = DAYS_PATH / f"day{day:02d}" / "input.txt"
+        input_file_path.write_text(input_content, encoding="utf-8")
+        print(f"[green]File [bold]{input_file_path}[/bold] created.[/green]")
+
+    if None in inputs.values():
+        raise typer.Exit(1)
+
+
 @app.command()
 def create_next_day():
     """
@@ -0,0 +1,78 @@
+from array import array
+from itertools import accumulate
+from typing import Iterator
+
+from days.day01.main import PuzzleSolver as ReferencePuzzleSolver
+from scripts.utils import Engine
+
+# Parentheses are translated to signed bytes, other characters to 0
+FLOOR_CHANGES = bytearray(256)
+FLOOR_CHANGES[ord("(")] = 1
+FLOOR_CHANGES[ord(")")] = 0xFF  # -1 as a signed byte
+
+
+class PuzzleSolver(ReferencePuzzleSolver):
+    """Instructions are processed by fixed-size chunks of the mapped data
+    file, so memory stays bounded whatever the size of the input. Floors
+    are computed by counting parentheses of whole chunks, and positions
+    are only walked where the basement can be reached."""
+
+    engine = Engine.FAST
+    chunk_size: int = 2**20
+    block_size: int = 2**12
+
+    def __iter_chunks(self, size: int) -> Iterator[bytes]:
+        """Chunks of the instructions line, stopping at its end"""
+        for start in range(0, len(self.raw), size):
+            chunk = self.raw[start : start + size].tobytes()
+            if (end := chunk.find(b"\n")) != -1:
+                yield chunk[:end]
+                return
+            yield chunk
+
+    ###########################
+    # DAY 1 - First Part
+    ###########################
+
+    def _solve_first_part(self) -> int:
+        return sum(
+            chunk.count(b"(") - chunk.count(b")")
+            for chunk in self.__iter_chunks(self.chunk_size)
+        )
+
+    ###########################
+    # DAY 1 - Second Part
+    ###########################
+
+    def _solve_second_part(self) -> int:
+        floor = 0
+        position = 0
+
+        for chunk in self.__iter_chunks(self.chunk_size):
+            # The lowest floor of a chunk is at least the floor reached by
+            # going down first, in which case the whole chunk is skipped
+            if floor - chunk.count(b")") > -1:
+                floor += chunk.count(b"(") - chunk.count(b")")
+                position += len(chunk)
+                continue
+
+            for start in range(0, len(chunk), self.block_size):
+                block = chunk[start : start + self.block_size]
+                nb_down = block.count(b")")
+                if floor - nb_down > -1:
+                    floor += block.count(b"(") - nb_down
+                    position += len(block)
+                    continue
+
+                floors = list(
+                    accumulate(
+                        array("b", block.translate(FLOOR_CHANGES)), initial=floor
+                    )
+                )
+                if -1 in floors:
+                    return position + floors.index(-1)
+                floor = floors[-1]
+                position += len(block)
+
+        # Same answer as the reference engine if basement is never reached
+        return position
@@ -0,0 +1,15 @@
+from random import Random
+from typing import Iterator
+
+SIZES = [10**5, 10**6, 10**7]
+chunk_size = 10**6
+
+
+def generate(size: int, rng: Random) -> Iterator[str]:
+    """Single line of `size` parentheses, written by chunks"""
+    # Random bytes are translated, even ones go up and odd ones go down
+    to_parentheses = bytes.maketrans(bytes(range(256)), b"()" * 128)
+    for start in range(0, size, chunk_size):
+        nb_chars = min(chunk_size, size - start)
+        yield rng.randbytes(nb_chars).translate(to_parentheses).decode()
+    yield "\n"
@@ -0,0 +1,96 @@
+from array import array
+from itertools import repeat
+from operator import floordiv, mul
+from typing import Iterator
+
+from days.day02.main import Box
+from days.day02.main import PuzzleSolver as ReferencePuzzleSolver
+from scripts.utils import Engine
+
+# Dimensions are separated by "x", lines by "\n" (or "\r\n")
+SEPARATORS = bytes.maketrans(b"x\r", b"  ")
+
+
+class PuzzleSolver(ReferencePuzzleSolver):
+    """Dimensions of boxes are stored in three arrays (one by dimension)
+    instead of Box objects, parsed by chunks of the raw data. Totals are
+    computed column by column, with the sum of the two smallest dimensions
+    being the sum minus the largest one, and the smallest area being the
+    volume divided by the largest dimension."""
+
+    engine = Engine.FAST
+    chunk_size: int = 2**20
+
+    def _parse(self) -> None:
+        self.lengths = array("I")
+        self.widths = array("I")
+        self.heights = array("I")
+
+        for chunk in self.__iter_chunks():
+            dimensions = array("I", map(int, chunk.translate(SEPARATORS).split()))
+            if len(dimensions) % 3 != 0:
+                raise ValueError("Each box must have three dimensions")
+            self.lengths.extend(dimensions[0::3])
+            self.widths.extend(dimensions[1::3])
+            self.heights.extend(dimensions[2::3])
+
+        self.largest_dimensions = array(
+            "I", map(max, self.lengths, self.widths, self.heights)
+        )
+
+    def __iter_chunks(self) -> Iterator[bytes]:
+        """Chunks of the raw data, ending at the end of a line"""
+        start = 0
+        while start < len(self.raw):
+            chunk = self.raw[start : start + self.chunk_size].tobytes()
+            if start + len(chunk) < len(self.raw):
+                if (end := chunk.rfind(b"\n")) != -1:
+                    chunk = chunk[: end + 1]
+                else:
+                    # Line longer than a chunk, which is read up to its end
+                    end = self.raw.obj.find(b"\n", start + len(chunk))
+                    end = len(self.raw) if end == -1 else end + 1
+                    chunk = self.raw[start:end].tobytes()
+            yield chunk
+            start += len(chunk)
+
+    def __iter_volumes(self) -> Iterator[int]:
+        return map(mul, map(mul, self.lengths, self.widths), self.heights)
+
+    def iter_boxes(self) -> Iterator[Box]:
+        """Box objects of the parsed dimensions, only created on request"""
+        for length, width, height in zip(self.lengths, self.widths, self.heights):
+            yield Box(f"{length}x{width}x{height}")
+
+    ###########################
+    # DAY 2 - First Part
+    ###########################
+
+    def _solve_first_part(self) -> int:
+        total_surface = 2 * (
+            sum(map(mul, self.lengths, self.widths))
+            + sum(map(mul, self.widths, self.heights))
+            + sum(map(mul, self.heights, self.lengths))
+        )
+        # Largest dimension is 0 only for empty boxes, whose volume is 0 too
+        smallest_areas = sum(
+            map(
+                floordiv,
+                self.__iter_volumes(),
+                map(max, self.largest_dimensions, repeat(1)),
+            )
+        )
+        return total_surface + smallest_areas
+
+    ###########################
+    # DAY 2 - Second Part
+    ###########################
+
+    def _solve_second_part(self) -> int:
+        smallest_perimeters = 2 * (
+            sum(self.lengths)
+            + sum(self.widths)
+            + sum(self.heights)
+            - sum(self.largest_dimensions)
+        )
+        return smallest_perimeters + sum(self.__iter_volumes())
@@ -0,0 +1,11 @@
+from random import Random
+from typing import Iterator
+
+SIZES = [10**4, 10**5, 10**6]
+
+
+def generate(size: int, rng: Random) -> Iterator[str]:
+    """`size` boxes with dimensions between 1 and 30"""
+    for _ in range(size):
+        length, width, height = (rng.randint(1, 30) for _ in range(3))
+        yield f"{length}x{width}x{height}\n"
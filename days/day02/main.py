@@ -4,9 +4,8 @@ from scripts.utils import AbstractPuzzleSolver
 
 
 class PuzzleSolver(AbstractPuzzleSolver):
-    def solve(self) -> tuple[int, int]:
-        self.boxes = [Box(line) for line in self.lines]
-        return super().solve()
+    def _parse(self) -> None:
+        self.boxes = [Box(line) for line in self.iter_lines()]
 
     ###########################
     # DAY 2 - First Part
@@ -0,0 +1,68 @@
+from itertools import accumulate
+from typing import Iterator
+
+from days.day03.main import PuzzleSolver as ReferencePuzzleSolver
+from scripts.utils import Engine
+
+
+class PuzzleSolver(ReferencePuzzleSolver):
+    """Visited houses are packed integers instead of (x, y) tuples. The
+    positions of each deliverer are the cumulative sums of their moves,
+    computed by chunks of the raw data, and distinct houses are counted
+    with a set of these sums."""
+
+    engine = Engine.FAST
+    chunk_size: int = 2**20
+
+    def _parse(self) -> None:
+        # Coordinates are packed in a single integer, x * stride + y, so
+        # moving is a single addition. Positions stay distinct as long as
+        # |y| < stride / 2, which the number of moves guarantees. A stride
+        # close to the grid size also spreads hashes better than 2**32.
+        self.stride = 2 * len(self.raw) + 1
+
+        # Packed move of each byte, other characters don't move
+        self.moves = [0] * 256
+        self.moves[ord("^")] = -1
+        self.moves[ord("v")] = 1
+        self.moves[ord(">")] = self.stride
+        self.moves[ord("<")] = -self.stride
+
+    def __iter_chunks(self, nb_deliverers: int) -> Iterator[bytes]:
+        """Chunks of the moves line, each one starting with the move of
+        the first deliverer"""
+        size = self.chunk_size - self.chunk_size % nb_deliverers or nb_deliverers
+        for start in range(0, len(self.raw), size):
+            chunk = self.raw[start : start + size].tobytes()
+            if (end := chunk.find(b"\n")) != -1:
+                yield chunk[:end]
+                return
+            yield chunk
+
+    def __count_houses(self, nb_deliverers: int) -> int:
+        houses = {0}
+        positions = [0] * nb_deliverers
+        for chunk in self.__iter_chunks(nb_deliverers):
+            for deliverer, position in enumerate(positions):
+                moves = chunk[deliverer::nb_deliverers]
+                houses.update(
+                    accumulate(map(self.moves.__getitem__, moves), initial=position)
+                )
+                positions[deliverer] += (moves.count(b"v") - moves.count(b"^")) + (
+                    moves.count(b">") - moves.count(b"<")
+                ) * self.stride
+        return len(houses)
+
+    ###########################
+    # DAY 3 - First Part
+    ###########################
+
+    def _solve_first_part(self) -> int:
+        return self.__count_houses(nb_deliverers=1)
+
+    ###########################
+    # DAY 3 - Second Part
+    ###########################
+
+    def _solve_second_part(self) -> int:
+        return self.__count_houses(nb_deliverers=self.nb_deliverers)
@@ -0,0 +1,14 @@
+from random import Random
+from typing import Iterator
+
+SIZES = [10**4, 10**5, 10**6]
+chunk_size = 10**6
+
+
+def generate(size: int, rng: Random) -> Iterator[str]:
+    """Single line of `size` moves, written by chunks"""
+    to_moves = bytes.maketrans(bytes(range(256)), b"^v<>" * 64)
+    for start in range(0, size, chunk_size):
+        nb_moves = min(chunk_size, size - start)
+        yield rng.randbytes(nb_moves).translate(to_moves).decode()
+    yield "\n"
@@ -2,7 +2,9 @@ from scripts.utils import AbstractPuzzleSolver
 
 
 class PuzzleSolver(AbstractPuzzleSolver):
-    houses: set[tuple[int, int]] = set()
+    houses: set[tuple[int, int]]
+    nb_deliverers: int = 2  # Santa and the robots in second part
+    parameters = ("nb_deliverers",)
 
     def __visit_houses(self, line: str):
         # Give the initial gift
@@ -41,11 +43,11 @@ class PuzzleSolver(AbstractPuzzleSolver):
 
     def _solve_second_part(self) -> int:
         self.houses = set()
-        santa_line, robot_line = self.__split_delivery(self.line)
-        self.__visit_houses(santa_line)
-        self.__visit_houses(robot_line)
+        for deliverer_line in self.__split_delivery(self.line, self.nb_deliverers):
+            self.__visit_houses(deliverer_line)
         return len(self.houses)
 
     @staticmethod
-    def __split_delivery(line: str) -> tuple[str, str]:
-        return line[::2], line[1::2]
+    def __split_delivery(line: str, nb_deliverers: int) -> list[str]:
+        """Deliverers take turns, each one following every nb_deliverers move"""
+        return [line[deliverer::nb_deliverers] for deliverer in range(nb_deliverers)]
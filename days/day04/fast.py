@@ -0,0 +1,166 @@
+import multiprocessing
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from hashlib import md5
+from multiprocessing.sharedctypes import Synchronized
+
+from days.day04.main import PuzzleSolver as ReferencePuzzleSolver
+from scripts.utils import Engine
+
+# Smallest nonce of the highest difficulty found by any worker, 0 if none
+# was found yet. Set in each worker process by init_miner().
+smallest_nonce: Synchronized
+
+
+def init_miner(shared_smallest_nonce: Synchronized) -> None:
+    global smallest_nonce
+    smallest_nonce = shared_smallest_nonce
+
+
+# Last three digits of nonces
+SUFFIXES = [b"%03d" % suffix for suffix in range(1000)]
+
+
+def count_leading_zeros(digest: bytes) -> int:
+    """Number of leading zero nibbles (hexadecimal digits) of a digest"""
+    zero_bytes = len(digest) - len(digest.lstrip(b"\0"))
+    if zero_bytes < len(digest) and digest[zero_bytes] < 0x10:
+        return 2 * zero_bytes + 1
+    return 2 * zero_bytes
+
+
+def mine_chunk(
+    key: bytes, start: int, stop: int, difficulties: tuple[int, ...]
+) -> list[int | None]:
+    """First nonce between start and stop for each difficulty (sorted),
+    None if there is none. Mining stops once the highest difficulty is
+    reached, or if a smaller nonce was already found in another chunk."""
+    # The key is hashed once, then the hash is copied for each thousand of
+    # nonces and updated with their leading digits, then copied for each
+    # nonce and updated with its last three digits
+    key_hash = md5(key)
+    # Digests are first filtered on bytes of the lowest difficulty
+    zero_bytes = bytes(difficulties[0] // 2)
+    has_zero_nibble = difficulties[0] % 2 == 1
+
+    nonces: list[int | None] = [None] * len(difficulties)
+    nb_found = 0
+    for thousand in range(start // 1000, (stop - 1) // 1000 + 1):
+        if 0 < smallest_nonce.value < start:
+            return nonces
+
+        first_nonce = max(start, thousand * 1000)
+        last_nonce = min(stop, thousand * 1000 + 1000)
+        thousand_hash = key_hash.copy()
+        if thousand == 0:
+            # Nonces below 1000 have no leading zeros
+            suffixes = [b"%d" % nonce for nonce in range(first_nonce, last_nonce)]
+        else:
+            thousand_hash.update(b"%d" % thousand)
+            suffixes = SUFFIXES[first_nonce % 1000 : last_nonce - thousand * 1000]
+
+        for nonce, suffix in enumerate(suffixes, first_nonce):
+            nonce_hash = thousand_hash.copy()
+            nonce_hash.update(suffix)
+            digest = nonce_hash.digest()
+            if not digest.startswith(zero_bytes) or (
+                has_zero_nibble and digest[len(zero_bytes)] >= 0x10
+            ):
+                continue
+
+            nb_zeros = count_leading_zeros(digest)
+            while nb_found < len(difficulties) and nb_zeros >= difficulties[nb_found]:
+                nonces[nb_found] = nonce
+                nb_found += 1
+            if nb_found == len(difficulties):
+                return nonces
+    return nonces
+
+
+class PuzzleSolver(ReferencePuzzleSolver):
+    """Nonces are mined by chunks on a process pool. Chunks are submitted in
+    order and nonces are only returned once every chunk before them was
+    mined, so they're the smallest ones. Nonces of both parts are found in
+    a single scan, stopping once the highest difficulty is reached."""
+
+    engine = Engine.FAST
+    parallel_parts: bool = False  # Both parts come from the same scan
+    chunk_size: int = 20_000
+
+    def _parse(self) -> None:
+        # Nonces of both parts are found by a single scan, timed as parsing
+        self.nonces = self.__mine(self.difficulties)
+
+    def __mine(self, difficulties: tuple[int, ...]) -> dict[int, int]:
+        """Smallest nonce of each difficulty"""
+        key = self.line.encode()
+        difficulties = tuple(sorted(set(difficulties)))
+        # Nonces found before the checkpoint are kept when resuming
+        start, nonces = self.resume_search(
+            default=[1, [None] * len(difficulties)],
+            search=f"difficulties {difficulties}",
+        )
+        nb_workers = self.nb_workers or os.cpu_count() or 1
+
+        shared_smallest_nonce = multiprocessing.Value("q", nonces[-1] or 0)
+        executor = ProcessPoolExecutor(
+            max_workers=nb_workers,
+            initializer=init_miner,
+            initargs=(shared_smallest_nonce,),
+        )
+        # Mined chunks by start nonce, ordered by start
+        chunks: dict[int, Future] = {}
+        next_start = start
+        try:
+            while True:
+                # Two chunks by worker, so none of them waits for the next one
+                while len(chunks) < 2 * nb_workers and (
+                    nonces[-1] is None or next_start < nonces[-1]
+                ):
+                    chunks[next_start] = executor.submit(
+                        mine_chunk,
+                        key,
+                        next_start,
+                        next_start + self.chunk_size,
+                        difficulties,
+                    )
+                    next_start += self.chunk_size
+
+                done, _ = wait(chunks.values(), return_when=FIRST_COMPLETED)
+                for chunk_start, future in list(chunks.items()):
+                    if future not in done:
+                        continue
+                    del chunks[chunk_start]
+                    for index, chunk_nonce in enumerate(future.result()):
+                        if chunk_nonce is not None and (
+                            nonces[index] is None or chunk_nonce < nonces[index]
+                        ):
+                            nonces[index] = chunk_nonce
+                if nonces[-1] is not None:
+                    shared_smallest_nonce.value = nonces[-1]
+
+                # Every nonce before the first chunk still mined was checked
+                mined_nonce = next(iter(chunks), next_start)
+                if nonces[-1] is not None and nonces[-1] < mined_nonce:
+                    return dict(zip(difficulties, nonces))
+                self.report_progress(
+                    iterations=mined_nonce, candidate=[mined_nonce, nonces]
+                )
+        finally:
+            # Running chunks all start after nonce 1, so they stop early
+            shared_smallest_nonce.value = 1
+            executor.shutdown(cancel_futures=True)
+
+    ###########################
+    # DAY 4 - First Part
+    ###########################
+
+    def _solve_first_part(self) -> int:
+        return self.nonces[self.difficulties[0]]
+
+    ###########################
+    # DAY 4 - Second Part
+    ###########################
+
+    def _solve_second_part(self) -> int:
+        return self.nonces[self.difficulties[1]]
@@ -0,0 +1,10 @@
+import string
+from random import Random
+from typing import Iterator
+
+SIZES = [8, 16, 32]
+
+
+def generate(size: int, rng: Random) -> Iterator[str]:
+    """Secret key of `size` lowercase letters"""
+    yield "".join(rng.choices(string.ascii_lowercase, k=size)) + "\n"
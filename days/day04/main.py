@@ -8,14 +8,19 @@ class PuzzleSolver(AbstractPuzzleSolver):
     # DAY 4 - Common Part
     ###########################
     number_of_zeros: int
+    difficulties: tuple[int, int] = (5, 6)  # Leading zeros of hashes by part
+    parameters = ("difficulties",)
+    parallel_parts: bool = True
 
     def __compute_hashes(self) -> int:
         self.zeros_string = self.number_of_zeros * "0"
-        number = 1
+        number = self.resume_search(default=1, search=f"{self.number_of_zeros} zeros")
         hashed_line = self.__get_hashed_line(number)
         while not self.__is_valid_hash(hashed_line):
             number += 1
             hashed_line = self.__get_hashed_line(number)
+            if number % self.progress_interval == 0:
+                self.report_progress(iterations=number, candidate=number)
         return number
 
     def __is_valid_hash(self, hashed_line: str) -> bool:
@@ -29,7 +34,7 @@ class PuzzleSolver(AbstractPuzzleSolver):
     # DAY 4 - First Part
     ###########################
     def _solve_first_part(self) -> int:
-        self.number_of_zeros = 5
+        self.number_of_zeros = self.difficulties[0]
         return self.__compute_hashes()
 
     ###########################
@@ -37,5 +42,5 @@ class PuzzleSolver(AbstractPuzzleSolver):
     ###########################
 
     def _solve_second_part(self) -> int:
-        self.number_of_zeros = 6
+        self.number_of_zeros = self.difficulties[1]
         return self.__compute_hashes()
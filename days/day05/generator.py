@@ -0,0 +1,12 @@
+import string
+from random import Random
+from typing import Iterator
+
+SIZES = [10**3, 10**4, 10**5]
+string_length = 16
+
+
+def generate(size: int, rng: Random) -> Iterator[str]:
+    """`size` strings of 16 lowercase letters"""
+    for _ in range(size):
+        yield "".join(rng.choices(string.ascii_lowercase, k=string_length)) + "\n"
@@ -11,7 +11,7 @@ class PuzzleSolver(AbstractPuzzleSolver):
     wrong_strings = {"ab", "cd", "pq", "xy"}
 
     def _solve_first_part(self) -> int:
-        return len([line for line in self.lines if self.__is_nice_string(line)])
+        return sum(1 for line in self.iter_lines() if self.__is_nice_string(line))
 
     def __is_nice_string(self, line: str) -> bool:
         return (
@@ -35,8 +35,8 @@ class PuzzleSolver(AbstractPuzzleSolver):
     ###########################
 
     def _solve_second_part(self) -> int:
-        return len(
-            [line for line in self.lines if self.__is_really_a_nice_string(line)]
+        return sum(
+            1 for line in self.iter_lines() if self.__is_really_a_nice_string(line)
         )
 
     def __is_really_a_nice_string(self, line: str) -> bool:
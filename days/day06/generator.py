@@ -0,0 +1,17 @@
+from random import Random
+from typing import Iterator
+
+SIZES = [250, 500, 1000]
+nb_instructions = 300
+instructions = ["turn on", "turn off", "toggle"]
+
+
+def generate(size: int, rng: Random) -> Iterator[str]:
+    """300 instructions on a grid of `size` x `size` lights"""
+    for _ in range(nb_instructions):
+        start_x, end_x = sorted(rng.randrange(size) for _ in range(2))
+        start_y, end_y = sorted(rng.randrange(size) for _ in range(2))
+        yield (
+            f"{rng.choice(instructions)} {start_x},{start_y} "
+            f"through {end_x},{end_y}\n"
+        )
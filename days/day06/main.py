@@ -1,5 +1,7 @@
 from enum import StrEnum
+from typing import NamedTuple
 
+from scripts.parsing import LinePattern
 from scripts.utils import AbstractPuzzleSolver
 
 
@@ -8,12 +10,45 @@ class PuzzleSolver(AbstractPuzzleSolver):
     # DAY 06 - Common Part
     ###########################
     lights_grid: "LightsGrid"
+    instruction_lines: list["InstructionLine"]
     grid_size: int = 1_000
+    instruction_pattern = LinePattern(
+        r"(turn on|turn off|toggle) ([0-9]+),([0-9]+) through ([0-9]+),([0-9]+)",
+        None,
+        int,
+        int,
+        int,
+        int,
+    )
+
+    def _parse(self) -> None:
+        self.instruction_lines = [
+            InstructionLine(
+                instruction=Instruction(instruction),
+                start_pos=(start_line, start_column),
+                end_pos=(end_line, end_column),
+            )
+            for (
+                instruction,
+                start_line,
+                start_column,
+                end_line,
+                end_column,
+            ) in self.instruction_pattern.parse(self.text)
+        ]
+        # Grid is at least 1000x1000, but can be larger for larger instructions
+        self.grid_size = max(
+            [self.grid_size]
+            + [
+                max(instruction_line.end_pos) + 1
+                for instruction_line in self.instruction_lines
+            ]
+        )
 
     def _solve(self, brightness: bool = False) -> None:
         self.lights_grid = LightsGrid(size=self.grid_size, brightness=brightness)
-        for line in self.lines:
-            self.lights_grid.apply_instruction_line(InstructionLine(line))
+        for instruction_line in self.instruction_lines:
+            self.lights_grid.apply_instruction_line(instruction_line)
         return self.lights_grid.lights_on
 
     ###########################
@@ -37,23 +72,11 @@ class Instruction(StrEnum):
     TURN_OFF = "turn off"
 
 
-class InstructionLine:
+class InstructionLine(NamedTuple):
     instruction: Instruction
     start_pos: tuple[int, int]
     end_pos: tuple[int, int]
 
-    def __init__(self, line: str):
-        line_parts = line.split()
-        if len(line_parts) == 5:
-            instruction_start, instruction_end, start_pos, _, end_pos = line_parts
-            instruction = f"{instruction_start} {instruction_end}"
-        else:
-            instruction, start_pos, _, end_pos = line_parts
-
-        self.instruction = Instruction(instruction)
-        self.start_pos = tuple(int(value) for value in start_pos.split(","))
-        self.end_pos = tuple(int(value) for value in end_pos.split(","))
-
     def __repr__(self) -> str:
         return (
             f"InstructionLine({self.instruction} -> {self.start_pos}..{self.end_pos})"
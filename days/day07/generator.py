@@ -0,0 +1,46 @@
+from random import Random
+from typing import Iterator
+
+SIZES = [10**2, 10**3, 10**4]
+max_depth = 200  # Signals are computed recursively, keep the circuit shallow
+binary_operators = ["AND", "OR"]
+shift_operators = ["LSHIFT", "RSHIFT"]
+
+
+def get_wire_name(index: int) -> str:
+    """Lowercase name of the wire, "a" and "b" being kept for the puzzle wires"""
+    name = ""
+    index += 2
+    while True:
+        index, remainder = divmod(index, 26)
+        name = chr(ord("a") + remainder) + name
+        if index == 0:
+            return name
+        index -= 1
+
+
+def generate(size: int, rng: Random) -> Iterator[str]:
+    """Circuit of `size` wires, plus the "a" and "b" wires"""
+    yield f"{rng.randrange(65536)} -> b\n"
+
+    depths: dict[str, int] = {"b": 0}
+    shallow_wires: list[str] = ["b"]
+    for index in range(size):
+        wire = get_wire_name(index)
+        first, second = rng.choice(shallow_wires), rng.choice(shallow_wires)
+
+        match rng.randrange(4):
+            case 0:
+                yield f"{first} {rng.choice(binary_operators)} {second} -> {wire}\n"
+            case 1:
+                yield f"{first} {rng.choice(shift_operators)} {rng.randint(1, 15)} -> {wire}\n"
+            case 2:
+                yield f"NOT {first} -> {wire}\n"
+            case 3:
+                yield f"{first} -> {wire}\n"
+
+        depths[wire] = max(depths[first], depths[second]) + 1
+        if depths[wire] < max_depth:
+            shallow_wires.append(wire)
+
+    yield f"{get_wire_name(size - 1) if size else 'b'} -> a\n"
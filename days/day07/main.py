@@ -1,16 +1,28 @@
 from enum import StrEnum
-from functools import cache
 
-from scripts.utils import AbstractPuzzleSolver
+from scripts.utils import AbstractPuzzleSolver, memoize
 
 
 class PuzzleSolver(AbstractPuzzleSolver):
+    signals: dict[str, "Signal"]
+
+    ###########################
+    # DAY 07 - Common Part
+    ###########################
+
+    def _parse(self) -> None:
+        self.signals = {
+            instruction.wire: instruction.signal
+            for line in self.lines
+            if (instruction := Instruction(line))
+        }
+
     ###########################
     # DAY 07 - First Part
     ###########################
 
     def _solve_first_part(self) -> int:
-        booklet = Booklet(lines=self.lines)
+        booklet = Booklet(signals=self.signals)
         return booklet["a"]
 
     ###########################
@@ -18,7 +30,7 @@ class PuzzleSolver(AbstractPuzzleSolver):
     ###########################
 
     def _solve_second_part(self) -> int:
-        booklet = Booklet(lines=self.lines)
+        booklet = Booklet(signals=self.signals)
         booklet["b"] = booklet["a"]
         booklet.reset()
         return booklet["a"]
@@ -58,16 +70,12 @@ class Instruction:
 
 
 class Booklet:
-    instructions: list[Instruction]
     signals: dict[str, Signal]
     signal_limit: int = 65535  # 2^16 - 1
 
-    def __init__(self, lines: list[str]):
-        self.signals = {
-            instruction.wire: instruction.signal
-            for line in lines
-            if (instruction := Instruction(line))
-        }
+    def __init__(self, signals: dict[str, Signal]):
+        # Copy signals as wires can be overridden in the booklet
+        self.signals = signals.copy()
 
     def __getitem__(self, wire_key: str) -> int:
         return self.get(wire_key)
@@ -75,14 +83,14 @@ class Booklet:
     def __setitem__(self, wire_key: str, value: int | str) -> int:
         self.signals[wire_key] = Signal(str(value))
 
-    @cache
+    @memoize
     def compute(self, key: str) -> int:
         try:
             return int(key)
         except ValueError:
             return self.get(key)
 
-    @cache
+    @memoize
     def get(self, wire_key: str) -> int:
         signal = self.signals[wire_key]
         match signal.operator:
@@ -0,0 +1,25 @@
+import string
+from random import Random
+from typing import Iterator
+
+SIZES = [10**3, 10**4, 10**5]
+max_string_length = 30
+
+
+def generate_char(rng: Random) -> str:
+    match rng.randrange(10):
+        case 0:
+            return "\\\\"
+        case 1:
+            return '\\"'
+        case 2:
+            return f"\\x{rng.randrange(256):02x}"
+        case _:
+            return rng.choice(string.ascii_lowercase)
+
+
+def generate(size: int, rng: Random) -> Iterator[str]:
+    """`size` quoted strings, with escaped backslashes, quotes and hexadecimal chars"""
+    for _ in range(size):
+        nb_chars = rng.randrange(max_string_length)
+        yield f'"{"".join(generate_char(rng) for _ in range(nb_chars))}"\n'
@@ -12,7 +12,7 @@ class PuzzleSolver(AbstractPuzzleSolver):
     def _solve_first_part(self) -> int:
         return sum(
             string.nb_char_of_code - string.nb_char_in_memory
-            for line in self.lines
+            for line in self.iter_lines()
             if (string := SantaString(line))
         )
 
@@ -23,7 +23,7 @@ class PuzzleSolver(AbstractPuzzleSolver):
     def _solve_second_part(self) -> int:
         return sum(
             string.nb_char_in_encoded_string - string.nb_char_of_code
-            for line in self.lines
+            for line in self.iter_lines()
             if (string := SantaString(line))
         )
 
@@ -0,0 +1,12 @@
+from itertools import combinations
+from random import Random
+from typing import Iterator
+
+SIZES = [6, 7, 8, 9]
+
+
+def generate(size: int, rng: Random) -> Iterator[str]:
+    """Distances between every pair of `size` cities"""
+    cities = [f"City{index}" for index in range(size)]
+    for first_city, second_city in combinations(cities, 2):
+        yield f"{first_city} to {second_city} = {rng.randint(10, 200)}\n"
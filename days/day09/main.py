@@ -1,21 +1,30 @@
 from itertools import permutations
 from typing import Callable
 
+from scripts.parsing import LinePattern
 from scripts.utils import AbstractPuzzleSolver
 
 
 class PuzzleSolver(AbstractPuzzleSolver):
     distances: dict[frozenset, int]
     locations: set[str]
+    distance_pattern = LinePattern(r"(\w+) to (\w+) = ([0-9]+)", None, None, int)
+
+    def _parse(self) -> None:
+        # Compute references of distances and set of locations
+        # Fills self.distances and self.locations
+        self.__compute_distances()
 
     def __compute_distances(self):
         self.distances = {}
         self.locations = set()
 
-        for line in self.lines:
-            distance = Distance(line)
-            self.distances[distance.locations] = distance.length
-            self.locations |= distance.locations
+        for first_location, second_location, length in self.distance_pattern.parse(
+            self.text
+        ):
+            locations = frozenset({first_location, second_location})
+            self.distances[locations] = length
+            self.locations |= locations
 
     def __compute_path(self, path: list[str]) -> int:
         return sum(
@@ -24,10 +33,6 @@ class PuzzleSolver(AbstractPuzzleSolver):
         )
 
     def _solve(self, get_result_func: Callable) -> int:
-        # Compute references of distances and set of locations
-        # Fills self.distances and self.locations
-        self.__compute_distances()
-
         # Gather a list of possible paths
         possible_paths = permutations(self.locations)
 
@@ -47,16 +52,3 @@ class PuzzleSolver(AbstractPuzzleSolver):
 
     def _solve_second_part(self) -> int:
         return self._solve(get_result_func=max)
-
-
-class Distance:
-    locations: frozenset[str]
-    length: int
-
-    def __init__(self, line: str):
-        first_location, _, second_location, _, length = line.split()
-        self.locations = frozenset({first_location, second_location})
-        self.length = int(length)
-
-    def __repr__(self) -> str:
-        return f"<Distance locations={self.locations} length={self.length} />"
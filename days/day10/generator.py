@@ -0,0 +1,9 @@
+from random import Random
+from typing import Iterator
+
+SIZES = [5, 10, 20, 40]
+
+
+def generate(size: int, rng: Random) -> Iterator[str]:
+    """Sequence of `size` digits, between 1 and 3 as in look-and-say sequences"""
+    yield "".join(rng.choices("123", k=size)) + "\n"
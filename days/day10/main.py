@@ -4,6 +4,8 @@ from scripts.utils import AbstractPuzzleSolver
 
 
 class PuzzleSolver(AbstractPuzzleSolver):
+    parallel_parts: bool = True
+
     def __look_and_say(self, number: str, iterations: int) -> int:
         """Recursive method for look and say"""
 
@@ -0,0 +1,11 @@
+import string
+from random import Random
+from typing import Iterator
+
+SIZES = [8, 16, 32, 64]
+allowed_letters = sorted(set(string.ascii_lowercase) - {"i", "o", "l"})
+
+
+def generate(size: int, rng: Random) -> Iterator[str]:
+    """Password of `size` lowercase letters"""
+    yield "".join(rng.choices(allowed_letters, k=size)) + "\n"
@@ -1,15 +1,14 @@
 import re
 import string
-from functools import cache, cached_property
+from functools import cached_property
 from itertools import pairwise
 
-from scripts.utils import AbstractPuzzleSolver
+from scripts.utils import AbstractPuzzleSolver, memoize
 
 
 class PuzzleSolver(AbstractPuzzleSolver):
     letters = list(string.ascii_lowercase)
     forbidden_letters = {"i", "o", "l"}
-    password_length = 8
 
     @cached_property
     def forbidden_letters_regexp(self) -> re.Pattern:
@@ -40,13 +39,21 @@ class PuzzleSolver(AbstractPuzzleSolver):
         return bool(self.three_letters_groups_regexp.search(letters))
 
     def __get_next_valid_password(self, password: str) -> str:
-        # First, increment earliest located invalid char for performances
-        next_password = self.__increment_earliest_invalid_char(password)
-
-        # Next phase, we should be good with invalid char for now
-        next_password = self.__get_next_password(next_password)
+        # Searches from different passwords can be done in the same part
+        if resumed_password := self.resume_search(default=None, search=password):
+            next_password = resumed_password
+        else:
+            # First, increment earliest located invalid char for performances
+            next_password = self.__increment_earliest_invalid_char(password)
+
+            # Next phase, we should be good with invalid char for now
+            next_password = self.__get_next_password(next_password)
+        iterations = 1
         while not self.__is_valid_password(next_password):
             next_password = self.__get_next_password(next_password)
+            iterations += 1
+            if iterations % self.progress_interval == 0:
+                self.report_progress(iterations=iterations, candidate=next_password)
         return next_password
 
     def __increment_earliest_invalid_char(self, password: str) -> str:
@@ -58,7 +65,7 @@ class PuzzleSolver(AbstractPuzzleSolver):
         # Construct a new string with next password and trailing "a"
         return (
             f"{self.__get_next_password(password[:char_idx+1])}"
-            f"{"a"*(self.password_length - char_idx - 1)}"
+            f"{"a"*(len(password) - char_idx - 1)}"
         )
 
     def __get_next_password(self, password: str) -> str:
@@ -69,7 +76,7 @@ class PuzzleSolver(AbstractPuzzleSolver):
         # Recursive stop case, we just have to increment last char
         return f"{password[:-1]}{self.__get_next_char(password[-1])}"
 
-    @cache
+    @memoize
     def __get_next_char(self, char: str) -> str:
         return chr(ord(char) + 1)
 
@@ -0,0 +1,38 @@
+import json
+from random import Random
+from typing import Any, Iterator
+
+SIZES = [10**3, 10**4, 10**5]
+max_children = 5
+max_depth = 20
+colors = ["red", "green", "blue", "orange", "violet", "yellow"]
+
+
+def generate_value(rng: Random, remaining: list[int], depth: int = 0) -> Any:
+    """Random JSON value, `remaining` being the number of values left to generate"""
+    remaining[0] -= 1
+    can_nest = remaining[0] > 0 and depth < max_depth
+    match rng.randrange(4) if can_nest else rng.randrange(2):
+        case 0:
+            return rng.randint(-100, 100)
+        case 1:
+            return rng.choice(colors)
+        case 2:
+            return [
+                generate_value(rng, remaining, depth + 1)
+                for _ in range(rng.randint(1, max_children))
+            ]
+        case 3:
+            return {
+                f"key{index}": generate_value(rng, remaining, depth + 1)
+                for index in range(rng.randint(1, max_children))
+            }
+
+
+def generate(size: int, rng: Random) -> Iterator[str]:
+    """JSON document of about `size` values, nested in lists and objects"""
+    remaining = [size]
+    document = []
+    while remaining[0] > 0:
+        document.append(generate_value(rng, remaining))
+    yield json.dumps(document, separators=(",", ":")) + "\n"
@@ -0,0 +1,20 @@
+from itertools import permutations
+from random import Random
+from typing import Iterator
+
+SIZES = [5, 6, 7, 8]
+
+
+def generate(size: int, rng: Random) -> Iterator[str]:
+    """Happiness of `size` guests sitting next to each other guest"""
+    guests = [
+        f"Guest{chr(ord('A') + index // 26)}{chr(ord('a') + index % 26)}"
+        for index in range(size)
+    ]
+    for guest, other_guest in permutations(guests, 2):
+        happiness = rng.randint(-100, 100)
+        action = "gain" if happiness >= 0 else "lose"
+        yield (
+            f"{guest} would {action} {abs(happiness)} happiness units "
+            f"by sitting next to {other_guest}.\n"
+        )
@@ -1,8 +1,7 @@
-import re
 from enum import StrEnum
-from functools import cached_property
 from itertools import permutations
 
+from scripts.parsing import LinePattern
 from scripts.utils import AbstractPuzzleSolver
 
 
@@ -18,12 +17,23 @@ class PuzzleSolver(AbstractPuzzleSolver):
     }
     nb_guests: int
     myself_name: str = "Myself"
-
-    @cached_property
-    def guest_line_pattern(self) -> re.Pattern:
-        return re.compile(
-            r"^([A-z]+) would (gain|lose) ([0-9]+) happiness units by sitting next to ([A-z]+)\.$"
-        )
+    relations: list[tuple[str, int, str]]
+
+    guest_line_pattern = LinePattern(
+        r"([A-z]+) would (gain|lose) ([0-9]+) happiness units by sitting next to ([A-z]+)\.",
+        None,
+        None,
+        int,
+        None,
+    )
+
+    def _parse(self) -> None:
+        self.relations = [
+            (guest, score * self.action_values[action], other_guest)
+            for guest, action, score, other_guest in self.guest_line_pattern.parse(
+                self.text
+            )
+        ]
 
     def __compute_guests(self, include_myself: bool) -> list["Guest"]:
         guests: dict[str, "Guest"] = {}
@@ -31,20 +41,14 @@ class PuzzleSolver(AbstractPuzzleSolver):
         if include_myself:
             guests[self.myself_name] = Guest(name=self.myself_name)
 
-        for line in self.lines:
-            guest, action, score, other_guest = self.guest_line_pattern.match(
-                line
-            ).groups()
-
+        for guest, happiness, other_guest in self.relations:
             if guest not in guests:
                 guests[guest] = Guest(name=guest)
                 if include_myself:
                     guests[self.myself_name].happiness[guest] = 0
                     guests[guest].happiness[self.myself_name] = 0
 
-            guests[guest].happiness[other_guest] = (
-                int(score) * self.action_values[action]
-            )
+            guests[guest].happiness[other_guest] = happiness
 
         self.nb_guests = len(guests)
 
@@ -0,0 +1,24 @@
+from random import Random
+from typing import Iterator
+
+SIZES = [10, 100, 1000]
+
+
+def get_reindeer_name(index: int) -> str:
+    """Reindeer names are made of letters only"""
+    name = "Reindeer"
+    while True:
+        index, remainder = divmod(index, 26)
+        name += chr(ord("a") + remainder)
+        if index == 0:
+            return name
+
+
+def generate(size: int, rng: Random) -> Iterator[str]:
+    """`size` reindeers with their speed, flying and resting durations"""
+    for index in range(size):
+        yield (
+            f"{get_reindeer_name(index)} can fly {rng.randint(1, 30)} km/s "
+            f"for {rng.randint(1, 20)} seconds, "
+            f"but then must rest for {rng.randint(20, 200)} seconds.\n"
+        )
@@ -1,13 +1,29 @@
-import re
 from enum import Enum, auto
-from functools import cached_property
-from typing import Iterable
+from typing import Iterable, NamedTuple
 
+from scripts.parsing import LinePattern
 from scripts.utils import AbstractPuzzleSolver
 
 
 class PuzzleSolver(AbstractPuzzleSolver):
     race_duration: int = 2503
+    reindeer_pattern = LinePattern(
+        r"([A-z]+) can fly ([0-9]+) km/s for ([0-9]+) seconds, but then must rest for ([0-9]+) seconds\.",
+        None,
+        int,
+        int,
+        int,
+    )
+    reindeers: list["Reindeer"]
+
+    ###########################
+    # DAY 14 - Common Part
+    ###########################
+
+    def _parse(self) -> None:
+        self.reindeers = list(
+            map(Reindeer._make, self.reindeer_pattern.parse(self.text))
+        )
 
     ###########################
     # DAY 14 - First Part
@@ -16,8 +32,7 @@ class PuzzleSolver(AbstractPuzzleSolver):
     def _solve_first_part(self) -> int:
         return max(
             reindeer.get_distance_traveled(seconds=self.race_duration)
-            for line in self.lines
-            if (reindeer := Reindeer(line))
+            for reindeer in self.reindeers
         )
 
     ###########################
@@ -25,11 +40,10 @@ class PuzzleSolver(AbstractPuzzleSolver):
     ###########################
 
     def _solve_second_part(self) -> int:
-        reindeers = [Reindeer(line) for line in self.lines]
         return max(
             score
             for score in self.__compute_race_scorings(
-                reindeers=reindeers, seconds=self.race_duration
+                reindeers=self.reindeers, seconds=self.race_duration
             )
         )
 
@@ -60,22 +74,11 @@ class PuzzleSolver(AbstractPuzzleSolver):
         yield from (states[reindeer].score for reindeer in reindeers)
 
 
-class Reindeer:
-    def __init__(self, line: str):
-        name, speed, duration, resting_time = self.reindeer_line_pattern.match(
-            line
-        ).groups()
-
-        self.name = name
-        self.speed = int(speed)
-        self.duration = int(duration)
-        self.resting_time = int(resting_time)
-
-    @cached_property
-    def reindeer_line_pattern(self) -> re.Pattern:
-        return re.compile(
-            r"^([A-z]+) can fly ([0-9]+) km/s for ([0-9]+) seconds, but then must rest for ([0-9]+) seconds\.$"
-        )
+class Reindeer(NamedTuple):
+    name: str
+    speed: int
+    duration: int
+    resting_time: int
 
     def get_distance_traveled(self, seconds: int) -> int:
         distance_traveled = 0
@@ -0,0 +1,16 @@
+from random import Random
+from typing import Iterator
+
+SIZES = [2, 3, 4]
+properties = ["capacity", "durability", "flavor", "texture"]
+
+
+def generate(size: int, rng: Random) -> Iterator[str]:
+    """`size` ingredients with their properties. Last ingredient has 5 calories,
+    so at least one cookie (made of it only) has 500 calories."""
+    for index in range(size):
+        values = ", ".join(
+            f"{property_name} {rng.randint(-3, 8)}" for property_name in properties
+        )
+        calories = 5 if index == size - 1 else rng.randint(1, 8)
+        yield f"Ingredient{chr(ord('a') + index)}: {values}, calories {calories}\n"
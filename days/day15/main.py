@@ -1,7 +1,6 @@
-import re
-from functools import cached_property
-from typing import Iterable
+from typing import Iterable, NamedTuple
 
+from scripts.parsing import LinePattern
 from scripts.utils import AbstractPuzzleSolver
 
 
@@ -9,13 +8,22 @@ class PuzzleSolver(AbstractPuzzleSolver):
     ###########################
     # DAY 15 - Common code
     ###########################
-    def solve(self) -> tuple[int, int]:
+    def _parse(self) -> None:
         self.ingredients = list(self.__compute_ingredients())
         self.possible_cookies = list(self.__get_possible_cookies(self.ingredients))
-        return super().solve()
+
+    ingredient_pattern = LinePattern(
+        r"([A-z]+): capacity (-?[0-9]+), durability (-?[0-9]+), flavor (-?[0-9]+), texture (-?[0-9]+), calories (-?[0-9]+)",
+        None,
+        int,
+        int,
+        int,
+        int,
+        int,
+    )
 
     def __compute_ingredients(self) -> Iterable["Ingredient"]:
-        yield from (Ingredient(line) for line in self.lines)
+        yield from map(Ingredient._make, self.ingredient_pattern.parse(self.text))
 
     def __get_possible_cookies(
         self, ingredients: list["Ingredient"]
@@ -63,31 +71,13 @@ class PuzzleSolver(AbstractPuzzleSolver):
         )
 
 
-class Ingredient:
-    def __init__(self, line: str):
-        name, capacity, durability, flavor, texture, calories = self.line_pattern.match(
-            line
-        ).groups()
-
-        self.name: str = name
-        self.capacity = int(capacity)
-        self.durability = int(durability)
-        self.flavor = int(flavor)
-        self.texture = int(texture)
-        self.calories = int(calories)
-
-    @cached_property
-    def line_pattern(self) -> re.Pattern:
-        return re.compile(
-            r"^([A-z]+): capacity (-?[0-9]+), durability (-?[0-9]+), flavor (-?[0-9]+), texture (-?[0-9]+), calories (-?[0-9]+)$"
-        )
-
-    def __repr__(self) -> str:
-        return (
-            f"<Ingredient name={self.name} capacity={self.capacity} "
-            f"durability={self.durability} flavor={self.flavor} "
-            f"texture={self.texture} calories={self.calories}>"
-        )
+class Ingredient(NamedTuple):
+    name: str
+    capacity: int
+    durability: int
+    flavor: int
+    texture: int
+    calories: int
 
 
 class Cookie:
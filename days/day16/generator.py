@@ -0,0 +1,53 @@
+from random import Random
+from typing import Iterator
+
+SIZES = [10**3, 10**4, 10**5]
+nb_properties = 3
+right_sue_values = {
+    "children": 3,
+    "cats": 7,
+    "samoyeds": 2,
+    "pomeranians": 3,
+    "akitas": 0,
+    "vizslas": 0,
+    "goldfish": 5,
+    "trees": 3,
+    "cars": 2,
+    "perfumes": 1,
+}
+greater_than_values = {"cats", "trees"}
+fewer_than_values = {"pomeranians", "goldfish"}
+
+
+def generate_sue_properties(rng: Random, is_real_one: bool) -> dict[str, int]:
+    """Properties of the Sue matching the exact values, or matching
+    the ranges if she's the real one"""
+    names = rng.sample(sorted(right_sue_values), k=nb_properties)
+    if not is_real_one:
+        return {name: right_sue_values[name] for name in names}
+
+    properties = {}
+    for name in names:
+        if name in greater_than_values:
+            properties[name] = right_sue_values[name] + rng.randint(1, 5)
+        elif name in fewer_than_values:
+            properties[name] = rng.randrange(right_sue_values[name])
+        else:
+            properties[name] = right_sue_values[name]
+    return properties
+
+
+def generate(size: int, rng: Random) -> Iterator[str]:
+    """`size` Sues with random properties, including the two ones to find"""
+    sue_number, real_sue_number = rng.sample(range(1, size + 1), k=2)
+    for number in range(1, size + 1):
+        if number in (sue_number, real_sue_number):
+            properties = generate_sue_properties(
+                rng, is_real_one=number == real_sue_number
+            )
+        else:
+            properties = {
+                name: rng.randint(0, 10)
+                for name in rng.sample(sorted(right_sue_values), k=nb_properties)
+            }
+        yield f"Sue {number}: {', '.join(f'{name}: {value}' for name, value in properties.items())}\n"
@@ -1,3 +1,7 @@
+import re
+from typing import Iterator
+
+from scripts.parsing import LinePattern
 from scripts.utils import AbstractPuzzleSolver
 
 
@@ -14,6 +18,26 @@ class PuzzleSolver(AbstractPuzzleSolver):
         "cars": 2,
         "perfumes": 1,
     }
+    # Sues can have any number of properties, parsed by property_regex
+    sue_pattern = LinePattern(
+        r"Sue ([0-9]+): (\w+: [0-9]+(?:, \w+: [0-9]+)*)", int, None
+    )
+    property_regex = re.compile(r"(\w+): ([0-9]+)")
+
+    ###########################
+    # DAY 16 - Common Part
+    ###########################
+
+    def _iter_sues(self) -> Iterator["Sue"]:
+        # Sues are parsed lazily, as searches stop at the first one found
+        for number, properties in self.sue_pattern.iter_parse(self.text):
+            yield Sue(
+                number=number,
+                properties={
+                    name: int(value)
+                    for name, value in self.property_regex.findall(properties)
+                },
+            )
 
     ###########################
     # DAY 16 - First Part
@@ -22,7 +46,7 @@ class PuzzleSolver(AbstractPuzzleSolver):
     def _solve_first_part(self) -> int:
         return next(
             sue.number
-            for sue in (Sue(line) for line in self.lines)
+            for sue in self._iter_sues()
             if sue.is_the_one(self.right_sue_values)
         )
 
@@ -33,7 +57,7 @@ class PuzzleSolver(AbstractPuzzleSolver):
     def _solve_second_part(self) -> int:
         return next(
             sue.number
-            for sue in (Sue(line) for line in self.lines)
+            for sue in self._iter_sues()
             if sue.is_really_the_one(self.right_sue_values)
         )
 
@@ -42,14 +66,9 @@ class Sue:
     greather_than_values: set[str] = {"cats", "trees"}
     fewer_than_values: set[str] = {"pomeranians", "goldfish"}
 
-    def __init__(self, line: str):
-        split_str = line.split(": ")
-        self.number = int(split_str[0].split()[1])
-        self.properties = {
-            prop_split[0]: int(prop_split[1])
-            for prop in ": ".join(split_str[1:]).split(", ")
-            if (prop_split := prop.split(": "))
-        }
+    def __init__(self, number: int, properties: dict[str, int]):
+        self.number = number
+        self.properties = properties
 
     def __repr__(self):
         return f"<Sue number={self.number} properties={self.properties}>"
@@ -0,0 +1,10 @@
+from random import Random
+from typing import Iterator
+
+SIZES = [10, 14, 18, 22]
+
+
+def generate(size: int, rng: Random) -> Iterator[str]:
+    """`size` containers with capacities between 5 and 50 liters"""
+    for _ in range(size):
+        yield f"{rng.randint(5, 50)}\n"
@@ -5,9 +5,11 @@ from scripts.utils import AbstractPuzzleSolver
 
 class PuzzleSolver(AbstractPuzzleSolver):
     liters_to_eggnog: int = 150
+    containers: list[int]
+    parallel_parts: bool = True
 
-    def __get_containers(self) -> list[int]:
-        return [int(line) for line in self.lines]
+    def _parse(self) -> None:
+        self.containers = [int(line) for line in self.lines]
 
     def __get_nb_combinations(self, containers: list[int], nb_containers: int) -> int:
         range_combinations = combinations(containers, nb_containers)
@@ -22,8 +24,7 @@ class PuzzleSolver(AbstractPuzzleSolver):
     ###########################
 
     def _solve_first_part(self) -> int:
-        containers = self.__get_containers()
-        return self.__get_nb_possible_combinations(containers)
+        return self.__get_nb_possible_combinations(self.containers)
 
     def __get_nb_possible_combinations(self, containers: list[int]) -> int:
         return sum(
@@ -36,8 +37,7 @@ class PuzzleSolver(AbstractPuzzleSolver):
     ###########################
 
     def _solve_second_part(self) -> int:
-        containers = self.__get_containers()
-        return self.__get_minimum_possible_combinations(containers)
+        return self.__get_minimum_possible_combinations(self.containers)
 
     def __get_minimum_possible_combinations(self, containers: list[int]) -> int | None:
         minimum_combinations = None
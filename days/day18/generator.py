@@ -0,0 +1,10 @@
+from random import Random
+from typing import Iterator
+
+SIZES = [25, 50, 100]
+
+
+def generate(size: int, rng: Random) -> Iterator[str]:
+    """Grid of `size` x `size` lights, randomly on or off"""
+    for _ in range(size):
+        yield "".join(rng.choices("#.", k=size)) + "\n"
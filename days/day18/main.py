@@ -1,9 +1,9 @@
 from dataclasses import dataclass
 from enum import StrEnum
-from functools import cache, cached_property
+from functools import cached_property
 
 
-from scripts.utils import AbstractPuzzleSolver
+from scripts.utils import AbstractPuzzleSolver, memoize
 
 
 class PuzzleSolver(AbstractPuzzleSolver):
@@ -11,14 +11,20 @@ class PuzzleSolver(AbstractPuzzleSolver):
     # DAY 06 - Common Part
     ###########################
     lights_grid: "LightsGrid"
+    initial_states: list[list["LightState"]]
     nb_steps: int = 100
 
+    def _parse(self) -> None:
+        self.initial_states = [
+            [LightState(state) for state in line] for line in self.lines
+        ]
+
     ###########################
     # DAY 06 - First Part
     ###########################
 
     def _solve_first_part(self) -> int:
-        self.lights_grid = LightsGrid(lines=self.lines)
+        self.lights_grid = LightsGrid(states=self.initial_states)
         for i in range(self.nb_steps):
             self.lights_grid.apply_next_step(corners_stuck=False)
         return self.lights_grid.get_nb_lights_on()
@@ -28,7 +34,7 @@ class PuzzleSolver(AbstractPuzzleSolver):
     ###########################
 
     def _solve_second_part(self) -> int:
-        self.lights_grid = LightsGrid(lines=self.lines)
+        self.lights_grid = LightsGrid(states=self.initial_states)
         self.lights_grid.set_corners_on()
         for i in range(self.nb_steps):
             self.lights_grid.apply_next_step(corners_stuck=True)
@@ -49,9 +55,9 @@ class LightsGrid:
     grid: list[list[Light]]
     size: int
 
-    def __init__(self, lines: list[str]):
-        self.size = len(lines)
-        self.grid = [[Light(state) for state in line] for line in lines]
+    def __init__(self, states: list[list[LightState]]):
+        self.size = len(states)
+        self.grid = [[Light(state) for state in line] for line in states]
 
     @cached_property
     def corners_coordinates(self) -> set[tuple[int, int]]:
@@ -95,7 +101,7 @@ class LightsGrid:
 
         return Light(state=new_state)
 
-    @cache
+    @memoize
     def is_corner_light(self, idx_line: int, idx_column: int) -> bool:
         return (idx_line, idx_column) in self.corners_coordinates
 
@@ -108,7 +114,7 @@ class LightsGrid:
             if (self.grid[i_line][i_column].state == LightState.ON)
         )
 
-    @cache
+    @memoize
     def get_neighbors_coordinates(
         self, idx_line: int, idx_column: int
     ) -> set[tuple[int, int]]:
@@ -0,0 +1,33 @@
+from random import Random
+from typing import Iterator
+
+SIZES = [100, 200, 400]
+replacements = [
+    ("e", "H"),
+    ("e", "O"),
+    ("H", "HO"),
+    ("H", "OH"),
+    ("O", "HH"),
+]
+
+
+def generate(size: int, rng: Random) -> Iterator[str]:
+    """Replacements and a molecule fabricated from "e" in `size` steps"""
+    for search, replacement in replacements:
+        yield f"{search} => {replacement}\n"
+
+    molecule = rng.choice(["H", "O"])
+    for _ in range(size):
+        # Replace a random element of the molecule
+        position = rng.randrange(len(molecule))
+        replacement = rng.choice(
+            [
+                replacement
+                for search, replacement in replacements
+                if search == molecule[position]
+            ]
+        )
+        molecule = f"{molecule[:position]}{replacement}{molecule[position + 1 :]}"
+
+    yield "\n"
+    yield f"{molecule}\n"
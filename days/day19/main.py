@@ -1,9 +1,7 @@
 import re
 from collections import defaultdict
-from functools import cache
 
-
-from scripts.utils import AbstractPuzzleSolver
+from scripts.utils import AbstractPuzzleSolver, memoize
 
 
 class PuzzleSolver(AbstractPuzzleSolver):
@@ -13,11 +11,7 @@ class PuzzleSolver(AbstractPuzzleSolver):
     ###########################
     # DAY 19 - Common Part
     ###########################
-    def solve(self) -> tuple[int, int]:
-        self._process_input()
-        return super().solve()
-
-    def _process_input(self) -> None:
+    def _parse(self) -> None:
         self.input_molecule = ""
         self.replacements = defaultdict(set)
 
@@ -55,7 +49,7 @@ class PuzzleSolver(AbstractPuzzleSolver):
             for replacement in replacements
         }
 
-    @cache
+    @memoize(maxsize=128)
     def _get_possible_substrings(
         self, search: str, input_string: str
     ) -> list[re.Match]:
@@ -0,0 +1,9 @@
+from random import Random
+from typing import Iterator
+
+SIZES = [10**4, 10**5, 10**6]
+
+
+def generate(size: int, rng: Random) -> Iterator[str]:
+    """Number of presents to reach, around `size`"""
+    yield f"{rng.randint(size, 2 * size)}\n"
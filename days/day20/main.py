@@ -9,10 +9,10 @@ class PuzzleSolver(AbstractPuzzleSolver):
     # DAY 20 - Common Part
     ###########################
     prime_limit = 10**6
+    parallel_parts: bool = True
 
-    def solve(self) -> tuple[int, int]:
+    def _parse(self) -> None:
         self.primes: list[int] = list(self.get_prime_numbers(self.prime_limit))
-        return super().solve()
 
     ###########################
     # DAY 20 - First Part
@@ -21,10 +21,13 @@ class PuzzleSolver(AbstractPuzzleSolver):
     def _solve_first_part(self) -> int:
         minimum_to_reach = int(self.line)
 
-        house_number = 0
+        # Resumed from the last house checked
+        house_number = self.resume_search(default=0)
         numbers_of_gift = 0
 
         while numbers_of_gift < minimum_to_reach:
+            if house_number % self.progress_interval == 0:
+                self.report_progress(iterations=house_number, candidate=house_number)
             house_number += 1
             numbers_of_gift = self.get_nb_gifts_for_house(
                 number=house_number, gifts_per_elf=10
@@ -95,10 +98,13 @@ class PuzzleSolver(AbstractPuzzleSolver):
     def _solve_second_part(self) -> int:
         minimum_to_reach = int(self.line)
 
-        house_number = 0
+        # Resumed from the last house checked
+        house_number = self.resume_search(default=0)
         numbers_of_gift = 0
 
         while numbers_of_gift < minimum_to_reach:
+            if house_number % self.progress_interval == 0:
+                self.report_progress(iterations=house_number, candidate=house_number)
             house_number += 1
             numbers_of_gift = self.get_naive_nb_gifts_for_house(
                 number=house_number, gifts_per_elf=11
@@ -0,0 +1,11 @@
+from random import Random
+from typing import Iterator
+
+SIZES = [100, 1000, 10000]
+
+
+def generate(size: int, rng: Random) -> Iterator[str]:
+    """Boss with `size` hit points"""
+    yield f"Hit Points: {size}\n"
+    yield f"Damage: {rng.randint(4, 10)}\n"
+    yield f"Armor: {rng.randint(1, 5)}\n"
@@ -19,7 +19,7 @@ class PuzzleSolver(AbstractPuzzleSolver):
     ###########################
     # DAY 21 - Common Part
     ###########################
-    def solve(self) -> tuple[int, int]:
+    def _parse(self) -> None:
         # Instanciate the boss
         self.boss = Boss.from_lines(self.lines)
 
@@ -27,8 +27,6 @@ class PuzzleSolver(AbstractPuzzleSolver):
         self._init_shop_data()
         self.stuff_combinations = self._get_stuff_combinations()
 
-        return super().solve()
-
     def _init_shop_data(self) -> None:
         shop_data_file = Path(__file__).parent / "shop.txt"
         print(f"Loading {shop_data_file}...")
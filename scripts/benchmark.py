@@ -0,0 +1,196 @@
+import json
+import statistics
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Callable
+
+from scripts.history import BenchmarkRecord, HistoryStore, get_timestamp
+from scripts.utils import (
+    CacheStatistics,
+    DataType,
+    Engine,
+    get_memoize_statistics,
+    get_puzzle_solver_class,
+    reset_memoize_statistics,
+)
+
+
+@dataclass
+class TimingStatistics:
+    min: float
+    median: float
+    p95: float
+
+    @classmethod
+    def from_timings(cls, timings: list[float]) -> "TimingStatistics":
+        # Quantiles need at least two values to be computed
+        p95 = (
+            statistics.quantiles(timings, n=20, method="inclusive")[-1]
+            if len(timings) > 1
+            else timings[0]
+        )
+        return cls(min=min(timings), median=statistics.median(timings), p95=p95)
+
+
+@dataclass
+class DayBenchmark:
+    day: int
+    data_hash: str
+    stages: dict[str, TimingStatistics] = field(default_factory=dict)
+    # Peak memory allocated by each stage (bytes), if traced
+    peak_memory: dict[str, int] = field(default_factory=dict)
+    # Statistics of memoized methods, over warm-up and timed runs
+    caches: dict[str, CacheStatistics] = field(default_factory=dict)
+
+
+@dataclass
+class Comparison:
+    day: int
+    stage: str
+    baseline_median: float
+    median: float
+
+    @property
+    def slowdown(self) -> float:
+        return self.median / self.baseline_median - 1
+
+
+def time_call(func: Callable) -> float:
+    start_time = time.perf_counter()
+    func()
+    return time.perf_counter() - start_time
+
+
+def measure_peak_memory(func: Callable) -> int:
+    """Peak memory allocated during a call, in bytes. Tracing allocations
+    slows the call down a lot, so it must not be timed."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def benchmark_day(
+    day: int,
+    data_type: DataType,
+    engine: Engine,
+    warmup: int,
+    repeats: int,
+    trace_memory: bool = True,
+) -> DayBenchmark:
+    """Benchmark parsing and both parts of a day separately. Warm-up runs are
+    complete solve() calls, so parsed data is ready for the parts afterwards.
+    Peak memory is measured on an additional untimed run of each stage."""
+    puzzle_solver = get_puzzle_solver_class(day, engine)(day=day, data_type=data_type)
+    reset_memoize_statistics()
+
+    for _ in range(warmup):
+        puzzle_solver.solve()
+
+    stages = {
+        "parse": partial(puzzle_solver.parse, force=True),
+        "first_part": puzzle_solver._solve_first_part,
+        "second_part": puzzle_solver._solve_second_part,
+    }
+    return DayBenchmark(
+        day=day,
+        data_hash=puzzle_solver.data_hash,
+        stages={
+            stage: TimingStatistics.from_timings(
+                [time_call(solve_stage) for _ in range(repeats)]
+            )
+            for stage, solve_stage in stages.items()
+        },
+        peak_memory=(
+            {
+                stage: measure_peak_memory(solve_stage)
+                for stage, solve_stage in stages.items()
+            }
+            if trace_memory
+            else {}
+        ),
+        caches=get_memoize_statistics(),
+    )
+
+
+class BenchmarkReport:
+    def __init__(self, data_type: DataType, engine: Engine, warmup: int, repeats: int):
+        self.data_type = data_type
+        self.engine = engine
+        self.warmup = warmup
+        self.repeats = repeats
+        self.days: dict[int, DayBenchmark] = {}
+
+    def add(self, day_benchmark: DayBenchmark) -> None:
+        self.days[day_benchmark.day] = day_benchmark
+
+    def to_dict(self) -> dict:
+        return {
+            "data_type": self.data_type.value,
+            "engine": self.engine.value,
+            "warmup": self.warmup,
+            "repeats": self.repeats,
+            "days": {
+                str(day): {
+                    stage: {
+                        **asdict(timing_statistics),
+                        "peak_memory": day_benchmark.peak_memory.get(stage),
+                    }
+                    for stage, timing_statistics in day_benchmark.stages.items()
+                }
+                for day, day_benchmark in self.days.items()
+            },
+            "caches": {
+                str(day): {
+                    name: asdict(cache_statistics)
+                    for name, cache_statistics in day_benchmark.caches.items()
+                }
+                for day, day_benchmark in self.days.items()
+                if day_benchmark.caches
+            },
+        }
+
+    def record(self, history: HistoryStore) -> None:
+        recorded_at = get_timestamp()
+        for day, day_benchmark in self.days.items():
+            for stage, timing_statistics in day_benchmark.stages.items():
+                history.add_benchmark(
+                    BenchmarkRecord(
+                        recorded_at=recorded_at,
+                        git_commit=history.git_commit,
+                        day=day,
+                        stage=stage,
+                        engine=self.engine.value,
+                        data_type=self.data_type.value,
+                        data_hash=day_benchmark.data_hash,
+                        min=timing_statistics.min,
+                        median=timing_statistics.median,
+                        p95=timing_statistics.p95,
+                        peak_memory=day_benchmark.peak_memory.get(stage),
+                    )
+                )
+
+    def save(self, report_path: Path) -> None:
+        report_path.write_text(json.dumps(self.to_dict(), indent=2))
+
+    def compare(self, baseline_path: Path) -> list[Comparison]:
+        """Compare medians against a previously saved report"""
+        baseline_days = json.loads(baseline_path.read_text())["days"]
+
+        return [
+            Comparison(
+                day=day,
+                stage=stage,
+                baseline_median=baseline_days[str(day)][stage]["median"],
+                median=timing_statistics.median,
+            )
+            for day, day_benchmark in self.days.items()
+            if str(day) in baseline_days
+            for stage, timing_statistics in day_benchmark.stages.items()
+            if stage in baseline_days[str(day)]
+        ]
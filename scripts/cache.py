@@ -0,0 +1,64 @@
+import json
+from hashlib import sha256
+from pathlib import Path
+from typing import Any
+
+from scripts.utils import CACHE_PATH, AbstractPuzzleSolver
+
+
+class ResultCache:
+    """On-disk cache of puzzle results. Entries are keyed by the hash of the
+    data file, the hash of the solver source code and the solver parameters,
+    so any change in one of them invalidates the result. Least recently used
+    entries are evicted once the cache holds more than max_entries results."""
+
+    cache_path: Path = CACHE_PATH / "results"
+    max_entries: int = 512
+
+    def __init__(self, max_entries: int | None = None):
+        if max_entries is not None:
+            self.max_entries = max_entries
+
+    def solve(self, puzzle_solver: AbstractPuzzleSolver) -> tuple[Any, Any]:
+        if (results := self.get(puzzle_solver)) is not None:
+            return results
+
+        results = puzzle_solver.solve()
+        self.set(puzzle_solver, results)
+        return results
+
+    def get(self, puzzle_solver: AbstractPuzzleSolver) -> tuple[Any, Any] | None:
+        entry_file = self.__get_entry_file(puzzle_solver)
+        if not entry_file.exists():
+            return None
+
+        try:
+            results = tuple(json.loads(entry_file.read_text()))
+        except json.JSONDecodeError:
+            return None
+
+        # Update the modification time, used as last access time for eviction
+        entry_file.touch()
+        return results
+
+    def set(self, puzzle_solver: AbstractPuzzleSolver, results: tuple[Any, Any]):
+        self.cache_path.mkdir(parents=True, exist_ok=True)
+        self.__get_entry_file(puzzle_solver).write_text(json.dumps(list(results)))
+        self.__evict()
+
+    def __get_entry_file(self, puzzle_solver: AbstractPuzzleSolver) -> Path:
+        key_data = f"{puzzle_solver.data_hash}:{puzzle_solver.get_source_hash()}"
+        # Results of solvers without parameters keep the same key
+        if parameters := puzzle_solver.get_parameters():
+            key_data += f":{json.dumps(parameters, sort_keys=True)}"
+        key = sha256(key_data.encode()).hexdigest()
+        return self.cache_path / f"{key}.json"
+
+    def __evict(self) -> None:
+        entry_files = sorted(
+            self.cache_path.glob("*.json"),
+            key=lambda entry_file: entry_file.stat().st_mtime,
+            reverse=True,
+        )
+        for entry_file in entry_files[self.max_entries :]:
+            entry_file.unlink(missing_ok=True)
@@ -0,0 +1,112 @@
+import json
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from scripts.utils import CACHE_PATH
+
+if TYPE_CHECKING:
+    from scripts.utils import AbstractPuzzleSolver
+
+
+class CheckpointStore:
+    """On-disk checkpoints of long-running searches, so they can be resumed
+    after an interruption. There is one checkpoint by day, engine and stage,
+    holding the last position reported by the search. Checkpoints are keyed
+    by the hash of the data file, so ones of another input are ignored, and
+    hold the solver parameters, so ones of other parameters are ignored too.
+
+    A checkpoint is saved once every_seconds elapsed or every_iterations
+    were done since the previous one, and removed when the stage ends."""
+
+    checkpoints_path: Path = CACHE_PATH / "checkpoints"
+
+    def __init__(
+        self,
+        resume: bool = False,
+        every_seconds: float | None = 10.0,
+        every_iterations: int | None = None,
+    ):
+        self.resume = resume
+        self.every_seconds = every_seconds
+        self.every_iterations = every_iterations
+        self.last_save_time = time.perf_counter()
+        self.last_save_iterations = 0
+
+    def load(
+        self, puzzle_solver: "AbstractPuzzleSolver", stage: str, search: str
+    ) -> Any | None:
+        """Position saved for this search, if resuming and if there is one"""
+        if not self.resume:
+            return None
+
+        checkpoint_file = self.__get_checkpoint_file(puzzle_solver, stage)
+        if not checkpoint_file.exists():
+            return None
+
+        try:
+            checkpoint = json.loads(checkpoint_file.read_text())
+        except json.JSONDecodeError:
+            return None
+
+        # Parameters are compared once encoded, as tuples are saved as lists
+        parameters = json.loads(json.dumps(puzzle_solver.get_parameters()))
+        if checkpoint["search"] != search or checkpoint.get("parameters") != parameters:
+            return None
+
+        self.last_save_iterations = checkpoint["iterations"]
+        return checkpoint["position"]
+
+    def save(
+        self,
+        puzzle_solver: "AbstractPuzzleSolver",
+        stage: str,
+        search: str,
+        iterations: int,
+        position: Any,
+        force: bool = False,
+    ) -> None:
+        now = time.perf_counter()
+        is_due = (
+            self.every_seconds is not None
+            and now - self.last_save_time >= self.every_seconds
+        ) or (
+            self.every_iterations is not None
+            and iterations - self.last_save_iterations >= self.every_iterations
+        )
+        if not (is_due or force):
+            return
+
+        checkpoint_file = self.__get_checkpoint_file(puzzle_solver, stage)
+        checkpoint_file.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write then rename, so an interruption can't corrupt the checkpoint
+        temporary_file = checkpoint_file.with_suffix(".tmp")
+        temporary_file.write_text(
+            json.dumps(
+                {
+                    "data_hash": puzzle_solver.data_hash,
+                    "search": search,
+                    "parameters": puzzle_solver.get_parameters(),
+                    "iterations": iterations,
+                    "position": position,
+                }
+            )
+        )
+        temporary_file.replace(checkpoint_file)
+
+        self.last_save_time = now
+        self.last_save_iterations = iterations
+
+    def clear(self, puzzle_solver: "AbstractPuzzleSolver", stage: str) -> None:
+        self.__get_checkpoint_file(puzzle_solver, stage).unlink(missing_ok=True)
+        self.last_save_iterations = 0
+
+    def __get_checkpoint_file(
+        self, puzzle_solver: "AbstractPuzzleSolver", stage: str
+    ) -> Path:
+        return (
+            self.checkpoints_path
+            / f"day{puzzle_solver.day:02d}"
+            / f"{puzzle_solver.engine.value}_{stage}_{puzzle_solver.data_hash}.json"
+        )
@@ -0,0 +1,142 @@
+import json
+import os
+import socket
+import socketserver
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from scripts.cache import ResultCache
+from scripts.utils import (
+    AbstractPuzzleSolver,
+    DataType,
+    Engine,
+    get_available_days,
+    get_puzzle_solver_class,
+)
+
+# Solvers kept warm in each worker process, with their data already parsed.
+# Least recently used ones are evicted, so memory stays bounded when many
+# different data files are solved.
+warm_puzzle_solvers: OrderedDict[tuple, AbstractPuzzleSolver] = OrderedDict()
+max_warm_puzzle_solvers = 32
+
+
+def load_day_modules() -> None:
+    """Worker initializer, importing every day module once"""
+    for day in get_available_days():
+        get_puzzle_solver_class(day)
+
+
+def get_warm_puzzle_solver(
+    day: int, engine: Engine, data_type: DataType, data_file: Path | None
+) -> AbstractPuzzleSolver:
+    puzzle_solver_class = get_puzzle_solver_class(day, engine)
+    puzzle_solver = puzzle_solver_class(
+        day=day, data_type=data_type, data_file=data_file
+    )
+
+    # Solvers are reused as long as their data file didn't change
+    key = (day, engine, puzzle_solver.data_file, puzzle_solver.data_hash)
+    if key in warm_puzzle_solvers:
+        warm_puzzle_solvers.move_to_end(key)
+        return warm_puzzle_solvers[key]
+
+    warm_puzzle_solvers[key] = puzzle_solver
+    if len(warm_puzzle_solvers) > max_warm_puzzle_solvers:
+        warm_puzzle_solvers.popitem(last=False)
+    return puzzle_solver
+
+
+def solve_request(request: dict[str, Any]) -> dict[str, Any]:
+    """Solve a request in a worker process. Top-level function so it can
+    be sent to a process pool."""
+    start_time = time.perf_counter()
+    try:
+        day = int(request["day"])
+    except (KeyError, TypeError, ValueError):
+        return {
+            "day": request.get("day"),
+            "error": "Invalid request: day must be an integer",
+        }
+
+    try:
+        puzzle_solver = get_warm_puzzle_solver(
+            day=day,
+            engine=Engine(request.get("engine", Engine.REFERENCE)),
+            data_type=DataType(request.get("data_type", DataType.INPUT)),
+            data_file=Path(request["data_file"]) if request.get("data_file") else None,
+        )
+        # The pool already solves requests in parallel
+        puzzle_solver.parallel_parts = False
+        puzzle_solver.nb_workers = 1
+        results = (
+            ResultCache().solve(puzzle_solver)
+            if request.get("cache", True)
+            else puzzle_solver.solve()
+        )
+    except ModuleNotFoundError:
+        return {"day": day, "error": "No puzzle solver"}
+    except FileNotFoundError:
+        return {"day": day, "error": "Data file not found"}
+    except Exception as error:
+        return {"day": day, "error": f"{type(error).__name__}: {error}"}
+
+    return {
+        "day": day,
+        "results": list(results),
+        "duration": time.perf_counter() - start_time,
+    }
+
+
+class SolverRequestHandler(socketserver.StreamRequestHandler):
+    """Each line received is a JSON request, answered by a JSON line"""
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+            except json.JSONDecodeError as error:
+                response = {"error": f"Invalid request: {error}"}
+            else:
+                response = self.__solve(request)
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+
+    def __solve(self, request: Any) -> dict[str, Any]:
+        if not isinstance(request, dict):
+            return {"error": "Invalid request: a JSON object is expected"}
+        # Errors of the pool itself (ex: a crashed worker) mustn't close
+        # the connection, other requests can still be answered
+        try:
+            return self.server.executor.submit(solve_request, request).result()
+        except Exception as error:
+            return {"error": f"{type(error).__name__}: {error}"}
+
+
+class SolverServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path: Path, max_workers: int | None = None):
+        self.executor = ProcessPoolExecutor(
+            max_workers=max_workers or os.cpu_count(),
+            initializer=load_day_modules,
+        )
+        socket_path.parent.mkdir(parents=True, exist_ok=True)
+        socket_path.unlink(missing_ok=True)
+        super().__init__(str(socket_path), SolverRequestHandler)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.executor.shutdown(cancel_futures=True)
+        Path(self.server_address).unlink(missing_ok=True)
+
+
+def send_request(socket_path: Path, request: dict[str, Any]) -> dict[str, Any]:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(str(socket_path))
+        with client.makefile("rwb") as stream:
+            stream.write(json.dumps(request).encode() + b"\n")
+            stream.flush()
+            return json.loads(stream.readline())
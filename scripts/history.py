@@ -0,0 +1,253 @@
+import math
+import sqlite3
+import subprocess
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from itertools import groupby, pairwise
+from pathlib import Path
+
+from scripts.utils import CACHE_PATH, ROOT_PATH, DataType, Engine
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS benchmarks (
+    recorded_at TEXT NOT NULL,
+    git_commit TEXT NOT NULL,
+    day INTEGER NOT NULL,
+    stage TEXT NOT NULL,
+    engine TEXT NOT NULL,
+    data_type TEXT NOT NULL,
+    data_hash TEXT NOT NULL,
+    min REAL NOT NULL,
+    median REAL NOT NULL,
+    p95 REAL NOT NULL,
+    peak_memory INTEGER
+);
+CREATE TABLE IF NOT EXISTS runs (
+    recorded_at TEXT NOT NULL,
+    git_commit TEXT NOT NULL,
+    day INTEGER NOT NULL,
+    engine TEXT NOT NULL,
+    data_type TEXT NOT NULL,
+    data_hash TEXT NOT NULL,
+    duration REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS benchmarks_day ON benchmarks (day, stage, engine);
+CREATE INDEX IF NOT EXISTS runs_day ON runs (day, data_type);
+"""
+
+
+def get_git_commit() -> str:
+    """Short hash of the current commit, suffixed with "-dirty" if there
+    are uncommitted changes, or "unknown" outside of a git repository"""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT_PATH,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=ROOT_PATH,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+    return f"{commit}-dirty" if status else commit
+
+
+@dataclass
+class BenchmarkRecord:
+    recorded_at: str
+    git_commit: str
+    day: int
+    stage: str
+    engine: str
+    data_type: str
+    data_hash: str
+    min: float
+    median: float
+    p95: float
+    peak_memory: int | None
+
+
+@dataclass
+class Slowdown:
+    day: int
+    stage: str
+    engine: str
+    previous_commit: str
+    git_commit: str
+    previous_median: float
+    median: float
+
+    @property
+    def ratio(self) -> float:
+        return self.median / self.previous_median - 1
+
+
+class HistoryStore:
+    """SQLite database of benchmark results and solving times, across
+    commits. Benchmarks are used to follow performance trends, solving
+    times of run-all to start the slowest days first."""
+
+    database_file: Path = CACHE_PATH / "history.sqlite3"
+
+    def __init__(self, database_file: Path | None = None):
+        if database_file is not None:
+            self.database_file = database_file
+        self.database_file.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(self.database_file)
+        self.connection.executescript(SCHEMA)
+        self.git_commit = get_git_commit()
+
+    def __enter__(self) -> "HistoryStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.connection.close()
+
+    def add_benchmark(self, record: BenchmarkRecord) -> None:
+        with self.connection:
+            self.connection.execute(
+                "INSERT INTO benchmarks VALUES "
+                "(:recorded_at, :git_commit, :day, :stage, :engine, :data_type, "
+                ":data_hash, :min, :median, :p95, :peak_memory)",
+                record.__dict__,
+            )
+
+    def add_run(
+        self,
+        day: int,
+        engine: Engine,
+        data_type: DataType,
+        data_hash: str,
+        duration: float,
+    ) -> None:
+        with self.connection:
+            self.connection.execute(
+                "INSERT INTO runs VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    get_timestamp(),
+                    self.git_commit,
+                    day,
+                    engine.value,
+                    data_type.value,
+                    data_hash,
+                    duration,
+                ),
+            )
+
+    def get_benchmarks(
+        self, days: list[int] | None = None, engine: Engine | None = None
+    ) -> list[BenchmarkRecord]:
+        query = "SELECT * FROM benchmarks WHERE 1"
+        parameters: list = []
+        if days:
+            query += f" AND day IN ({', '.join('?' * len(days))})"
+            parameters += days
+        if engine is not None:
+            query += " AND engine = ?"
+            parameters.append(engine.value)
+        query += (
+            " ORDER BY day, stage, engine, data_type, data_hash, recorded_at, rowid"
+        )
+
+        return [
+            BenchmarkRecord(*row)
+            for row in self.connection.execute(query, parameters).fetchall()
+        ]
+
+    def get_expected_duration(self, day: int, data_type: DataType) -> float:
+        """Last solving time of the day in run-all or, if it never ran there,
+        sum of the last benchmark medians of its stages. Days never measured
+        are considered as the slowest ones."""
+        run = self.connection.execute(
+            "SELECT duration FROM runs WHERE day = ? AND data_type = ? "
+            "ORDER BY recorded_at DESC, rowid DESC LIMIT 1",
+            (day, data_type.value),
+        ).fetchone()
+        if run is not None:
+            return run[0]
+
+        stages = self.connection.execute(
+            "SELECT stage, median FROM benchmarks "
+            "WHERE day = ? AND data_type = ? AND engine = ? "
+            "ORDER BY recorded_at, rowid",
+            (day, data_type.value, Engine.REFERENCE.value),
+        ).fetchall()
+        if not stages:
+            return math.inf
+
+        # Later records of each stage override the previous ones
+        return sum(dict(stages).values())
+
+
+def get_timestamp() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+@dataclass
+class TrendPoint:
+    git_commit: str
+    recorded_at: str
+    median: float
+    peak_memory: int | None
+
+
+# Trends are followed by day, stage, engine, data type and data hash
+TrendKey = tuple[int, str, str, str, str]
+
+
+def get_trends(records: list[BenchmarkRecord]) -> dict[TrendKey, list[TrendPoint]]:
+    """Benchmarks of each commit, ordered by time. The last benchmark of a
+    commit is kept if there are several ones. Records must be sorted by
+    key then time, as returned by HistoryStore.get_benchmarks()."""
+    trends = {}
+    for key, series in groupby(
+        records,
+        key=lambda record: (
+            record.day,
+            record.stage,
+            record.engine,
+            record.data_type,
+            record.data_hash,
+        ),
+    ):
+        points_by_commit: dict[str, TrendPoint] = {}
+        for record in series:
+            # Re-inserted so commits stay ordered by their last benchmark
+            points_by_commit.pop(record.git_commit, None)
+            points_by_commit[record.git_commit] = TrendPoint(
+                git_commit=record.git_commit,
+                recorded_at=record.recorded_at,
+                median=record.median,
+                peak_memory=record.peak_memory,
+            )
+        trends[key] = list(points_by_commit.values())
+    return trends
+
+
+def find_slowdowns(
+    trends: dict[TrendKey, list[TrendPoint]], threshold: float
+) -> list[Slowdown]:
+    """Commits whose median is slower than the previous commit one by
+    more than threshold percent"""
+    return [
+        Slowdown(
+            day=day,
+            stage=stage,
+            engine=engine,
+            previous_commit=previous_point.git_commit,
+            git_commit=point.git_commit,
+            previous_median=previous_point.median,
+            median=point.median,
+        )
+        for (day, stage, engine, _, _), points in trends.items()
+        for previous_point, point in pairwise(points)
+        if (point.median / previous_point.median - 1) * 100 > threshold
+    ]
@@ -0,0 +1,297 @@
+import gc
+import linecache
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Iterator
+
+from rich.markup import escape
+from rich.table import Table
+
+from scripts.utils import ROOT_PATH
+
+
+@dataclass
+class StageMeasure:
+    wall_time: float  # seconds
+    cpu_time: float  # seconds
+    peak_memory: int  # bytes allocated above stage start, 0 if not traced
+    gc_collections: tuple[int, int, int]  # by generation
+
+
+class Instrumentation:
+    """Stage hook measuring wall time, process CPU time, peak memory and
+    garbage collections of each stage of a puzzle solver.
+
+    Tracing memory allocations slows down the solver a lot, it can
+    be disabled to get more accurate timings."""
+
+    def __init__(self, trace_memory: bool = True):
+        self.trace_memory = trace_memory
+        self.measures: dict[str, StageMeasure] = {}
+
+    @contextmanager
+    def __call__(self, stage: str) -> Iterator[None]:
+        started_tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+            start_memory = tracemalloc.get_traced_memory()[0]
+
+        start_collections = [generation["collections"] for generation in gc.get_stats()]
+        start_cpu_time = time.process_time()
+        start_wall_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            wall_time = time.perf_counter() - start_wall_time
+            cpu_time = time.process_time() - start_cpu_time
+            collections = tuple(
+                generation["collections"] - start_collection
+                for generation, start_collection in zip(
+                    gc.get_stats(), start_collections
+                )
+            )
+
+            peak_memory = 0
+            if self.trace_memory:
+                peak_memory = tracemalloc.get_traced_memory()[1] - start_memory
+            if started_tracing:
+                tracemalloc.stop()
+
+            self.measures[stage] = StageMeasure(
+                wall_time=wall_time,
+                cpu_time=cpu_time,
+                peak_memory=peak_memory,
+                gc_collections=collections,
+            )
+
+    def to_dict(self) -> dict[str, dict]:
+        return {stage: asdict(measure) for stage, measure in self.measures.items()}
+
+    def to_table(self) -> Table:
+        table = Table(title="Instrumentation")
+        table.add_column("Stage")
+        table.add_column("Wall time", justify="right")
+        table.add_column("CPU time", justify="right")
+        table.add_column("Peak memory", justify="right")
+        table.add_column("GC runs (gen 0/1/2)", justify="right")
+        for stage, measure in self.measures.items():
+            table.add_row(
+                stage.replace("_", " "),
+                f"{measure.wall_time * 1000:.3f}ms",
+                f"{measure.cpu_time * 1000:.3f}ms",
+                (
+                    f"{measure.peak_memory / 1024**2:.3f}MiB"
+                    if self.trace_memory
+                    else "-"
+                ),
+                "/".join(str(count) for count in measure.gc_collections),
+            )
+        return table
+
+
+# Size and number of memory blocks allocated by each site (file and line)
+AllocationSizes = dict[tracemalloc.Traceback, tuple[int, int]]
+
+
+def get_allocation_sizes() -> AllocationSizes:
+    """Memory currently allocated by each site, excluding allocations of
+    tracemalloc itself and of the allocation tracker. Snapshots hold
+    one trace by memory block, so only their statistics are kept."""
+    snapshot = tracemalloc.take_snapshot().filter_traces(
+        (
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, threading.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+            tracemalloc.Filter(False, "<unknown>"),
+        )
+    )
+    return {
+        statistic.traceback: (statistic.size, statistic.count)
+        for statistic in snapshot.statistics("lineno")
+    }
+
+
+@dataclass
+class StageAllocations:
+    start_sizes: AllocationSizes
+    peak_sizes: AllocationSizes  # When memory was the highest
+    end_sizes: AllocationSizes
+    peak_memory: int  # bytes allocated above stage start
+
+    def get_allocated(self, sizes: AllocationSizes) -> AllocationSizes:
+        """Memory allocated by each site since the start of the stage"""
+        return {
+            traceback: (size - start_size, count - start_count)
+            for traceback, (size, count) in sizes.items()
+            for start_size, start_count in (self.start_sizes.get(traceback, (0, 0)),)
+        }
+
+
+class PeakSnapshotWatcher(threading.Thread):
+    """Thread polling the traced memory, and taking a new snapshot each
+    time it grows significantly, so allocations freed before the end of
+    a stage can still be reported"""
+
+    poll_interval: float = 0.01  # seconds
+    growth_threshold: float = 1.1  # New snapshot if memory grew by 10%
+
+    def __init__(self):
+        super().__init__(daemon=True)
+        self.highest_memory = 0
+        self.peak_memory = 0
+        self.peak_sizes: AllocationSizes | None = None
+        self.stopped = threading.Event()
+
+    def run(self) -> None:
+        self.highest_memory = self.peak_memory = tracemalloc.get_traced_memory()[0]
+        while not self.stopped.wait(self.poll_interval):
+            self.poll()
+
+    def poll(self) -> None:
+        # The peak of tracemalloc isn't reset, as other hooks may use it,
+        # so the peak of the stage is the highest polled memory
+        current_memory = tracemalloc.get_traced_memory()[0]
+        self.peak_memory = max(self.peak_memory, current_memory)
+        if current_memory > self.highest_memory * self.growth_threshold:
+            self.peak_sizes = get_allocation_sizes()
+            self.highest_memory = current_memory
+
+    def stop(self) -> None:
+        self.stopped.set()
+        self.join()
+
+
+class AllocationTracker:
+    """Stage hook reporting the sites (file and line) allocating the most
+    memory in each stage, at the memory peak of the stage and at its end.
+
+    Memory is polled by a thread while the stage runs, taking snapshots
+    as it grows, so the peak is approximate, and missed for very short
+    stages. The peak of tracemalloc is left untouched for other hooks."""
+
+    def __init__(self, top: int = 10):
+        self.top = top
+        self.stages: dict[str, StageAllocations] = {}
+
+    @contextmanager
+    def __call__(self, stage: str) -> Iterator[None]:
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+
+        # Created first, so the thread allocations are part of the start
+        watcher = PeakSnapshotWatcher()
+        start_sizes = get_allocation_sizes()
+        start_memory = tracemalloc.get_traced_memory()[0]
+        watcher.start()
+        try:
+            yield
+        finally:
+            watcher.stop()
+            end_memory = tracemalloc.get_traced_memory()[0]
+            peak_memory = max(end_memory, watcher.peak_memory)
+            end_sizes = get_allocation_sizes()
+            if started_tracing:
+                tracemalloc.stop()
+
+            self.stages[stage] = StageAllocations(
+                start_sizes=start_sizes,
+                peak_sizes=(
+                    watcher.peak_sizes
+                    if watcher.peak_sizes is not None
+                    and watcher.highest_memory > end_memory
+                    else end_sizes
+                ),
+                end_sizes=end_sizes,
+                peak_memory=peak_memory - start_memory,
+            )
+
+    def to_tables(self) -> list[Table]:
+        tables = []
+        for stage, allocations in self.stages.items():
+            peak_allocated = allocations.get_allocated(allocations.peak_sizes)
+            end_allocated = allocations.get_allocated(allocations.end_sizes)
+
+            table = Table(
+                title=(
+                    f"Top allocation sites of {stage.replace('_', ' ')} "
+                    f"(peak {allocations.peak_memory / 1024**2:.3f}MiB)"
+                )
+            )
+            table.add_column("Site", no_wrap=True, overflow="ellipsis", max_width=40)
+            table.add_column("At peak", justify="right", min_width=9)
+            table.add_column("Blocks", justify="right", min_width=6)
+            table.add_column("At end", justify="right", min_width=9)
+            top_allocated = sorted(
+                peak_allocated.items(), key=lambda item: item[1][0], reverse=True
+            )[: self.top]
+            for traceback, (size, count) in top_allocated:
+                if size <= 0:
+                    break
+                table.add_row(
+                    format_site(traceback),
+                    format_size(size),
+                    str(count),
+                    format_size(end_allocated.get(traceback, (0, 0))[0]),
+                )
+            tables.append(table)
+        return tables
+
+    def to_diff_table(self, stage: str, other_stage: str) -> Table:
+        """Sites allocating more (or less) at the peak of other stage than
+        at the peak of stage"""
+        allocations = self.stages[stage]
+        other_allocations = self.stages[other_stage]
+        allocated = allocations.get_allocated(allocations.peak_sizes)
+        other_allocated = other_allocations.get_allocated(other_allocations.peak_sizes)
+        size_diffs = {
+            traceback: (
+                other_allocated.get(traceback, (0, 0))[0]
+                - allocated.get(traceback, (0, 0))[0]
+            )
+            for traceback in allocated.keys() | other_allocated.keys()
+        }
+
+        table = Table(
+            title=(
+                f"Allocations at peak of {other_stage.replace('_', ' ')} "
+                f"compared to {stage.replace('_', ' ')}"
+            )
+        )
+        table.add_column("Site", no_wrap=True, overflow="ellipsis", max_width=40)
+        table.add_column("Difference", justify="right", min_width=9)
+        top_size_diffs = sorted(
+            size_diffs.items(), key=lambda item: abs(item[1]), reverse=True
+        )[: self.top]
+        for traceback, size_diff in top_size_diffs:
+            if size_diff == 0:
+                break
+            table.add_row(
+                format_site(traceback),
+                ("+" if size_diff > 0 else "-") + format_size(abs(size_diff)),
+            )
+        return table
+
+
+def format_site(traceback: tracemalloc.Traceback) -> str:
+    """File and line of the site, followed by its code on a second line"""
+    frame = traceback[0]
+    filename = Path(frame.filename)
+    if filename.is_relative_to(ROOT_PATH):
+        filename = filename.relative_to(ROOT_PATH)
+    code = linecache.getline(frame.filename, frame.lineno).strip()
+    return f"{filename}:{frame.lineno}\n[dim]{escape(code)}[/dim]"
+
+
+def format_size(size: int) -> str:
+    if size >= 1024**2:
+        return f"{size / 1024**2:.3f}MiB"
+    return f"{size / 1024:.1f}KiB"
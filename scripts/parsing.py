@@ -0,0 +1,71 @@
+import re
+from typing import Any, Callable, Iterator
+
+
+class LinePattern:
+    """Pattern of every line of an input, compiled once. The whole input is
+    parsed in a single pass over the text, instead of matching (or splitting)
+    each line separately, and each line gives a tuple of its groups, converted
+    by the given converters (one by group, values are kept as str if None).
+
+    Parsing fails if a line doesn't match the pattern, so a malformed input
+    can't be silently ignored."""
+
+    def __init__(self, pattern: str, *converters: Callable[[str], Any] | None):
+        # Lines are matched in the whole text, with or without \r\n endings
+        self.regex = re.compile(rf"^(?:{pattern})\r?$", re.MULTILINE)
+        if converters and len(converters) != self.regex.groups:
+            raise ValueError(
+                f"{len(converters)} converters given for {self.regex.groups} groups"
+            )
+        self.converters = converters
+
+    def parse(self, text: str) -> list[tuple]:
+        rows = self.regex.findall(text)
+        # Matches are tuples only if there are several groups
+        if self.regex.groups == 1:
+            rows = [(value,) for value in rows]
+
+        nb_lines = text.count("\n") + (not text.endswith("\n") and text != "")
+        if len(rows) != nb_lines:
+            raise ValueError(
+                f"{nb_lines - len(rows)} line(s) not matching {self.regex.pattern!r}"
+            )
+
+        if not self.converters:
+            return rows
+
+        # Values are converted column by column, which is much faster than
+        # converting each row separately
+        columns = zip(*rows)
+        return list(
+            zip(
+                *(
+                    column if converter is None else map(converter, column)
+                    for converter, column in zip(self.converters, columns)
+                )
+            )
+        )
+
+    def iter_parse(self, text: str) -> Iterator[tuple]:
+        """Lazily parse lines, for searches which can stop before the end
+        of the input. Only parsed lines are checked against the pattern."""
+        position = 0
+        for match in self.regex.finditer(text):
+            if match.start() != position:
+                raise ValueError(
+                    f"Line at {position} not matching {self.regex.pattern!r}"
+                )
+            # Next line starts after the line ending
+            position = match.end() + 1
+
+            if not self.converters:
+                yield match.groups()
+                continue
+            yield tuple(
+                value if converter is None else converter(value)
+                for converter, value in zip(self.converters, match.groups())
+            )
+
+        if position < len(text):
+            raise ValueError(f"Line at {position} not matching {self.regex.pattern!r}")
@@ -0,0 +1,105 @@
+import cProfile
+import tracemalloc
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from enum import StrEnum
+from pathlib import Path
+from typing import Iterator
+
+
+class ProfilerBackend(StrEnum):
+    PYINSTRUMENT = "pyinstrument"
+    CPROFILE = "cprofile"
+    TRACEMALLOC = "tracemalloc"
+
+
+class StageProfiler(ABC):
+    """Stage hook profiling each stage of a puzzle solver separately,
+    and writing the profiles of each stage in files of output path"""
+
+    def __init__(self, output_path: Path):
+        self.output_path = output_path
+        self.output_files: list[Path] = []
+
+    @contextmanager
+    def __call__(self, stage: str) -> Iterator[None]:
+        self._start()
+        try:
+            yield
+        finally:
+            self.output_path.mkdir(parents=True, exist_ok=True)
+            self.output_files.extend(self._stop(stage))
+
+    @abstractmethod
+    def _start(self) -> None: ...
+
+    @abstractmethod
+    def _stop(self, stage: str) -> list[Path]:
+        """Stop profiling, write profile files and return their paths"""
+
+
+class PyinstrumentProfiler(StageProfiler):
+    def _start(self) -> None:
+        from pyinstrument import Profiler
+
+        self.profiler = Profiler()
+        self.profiler.start()
+
+    def _stop(self, stage: str) -> list[Path]:
+        from pyinstrument.renderers import SpeedscopeRenderer
+
+        self.profiler.stop()
+
+        html_file = self.output_path / f"{stage}.html"
+        html_file.write_text(self.profiler.output_html())
+
+        speedscope_file = self.output_path / f"{stage}.speedscope.json"
+        speedscope_file.write_text(self.profiler.output(renderer=SpeedscopeRenderer()))
+
+        return [html_file, speedscope_file]
+
+
+class CProfileProfiler(StageProfiler):
+    def _start(self) -> None:
+        self.profiler = cProfile.Profile()
+        self.profiler.enable()
+
+    def _stop(self, stage: str) -> list[Path]:
+        self.profiler.disable()
+
+        pstats_file = self.output_path / f"{stage}.pstats"
+        self.profiler.dump_stats(pstats_file)
+
+        return [pstats_file]
+
+
+class TracemallocProfiler(StageProfiler):
+    nb_frames: int = 25
+
+    def _start(self) -> None:
+        # Don't interfere with tracing started by another stage hook
+        self.started_tracing = not tracemalloc.is_tracing()
+        if self.started_tracing:
+            tracemalloc.start(self.nb_frames)
+
+    def _stop(self, stage: str) -> list[Path]:
+        snapshot = tracemalloc.take_snapshot()
+        if self.started_tracing:
+            tracemalloc.stop()
+
+        # Snapshots can be loaded with tracemalloc.Snapshot.load()
+        snapshot_file = self.output_path / f"{stage}.tracemalloc"
+        snapshot.dump(str(snapshot_file))
+
+        return [snapshot_file]
+
+
+def get_stage_profiler(backend: ProfilerBackend, output_path: Path) -> StageProfiler:
+    match backend:
+        case ProfilerBackend.PYINSTRUMENT:
+            return PyinstrumentProfiler(output_path)
+        case ProfilerBackend.CPROFILE:
+            return CProfileProfiler(output_path)
+        case ProfilerBackend.TRACEMALLOC:
+            return TracemallocProfiler(output_path)
+    raise ValueError
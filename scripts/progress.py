@@ -0,0 +1,29 @@
+from rich.live import Live
+from rich.text import Text
+
+from scripts.utils import Progress
+
+
+class ProgressDisplay:
+    """Progress hook displaying a live line with the iteration rate and
+    the current candidate of the running search. Use it as a context
+    manager around the solve."""
+
+    def __init__(self):
+        self.live = Live(Text(""), refresh_per_second=4, transient=True)
+
+    def __enter__(self) -> "ProgressDisplay":
+        self.live.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.live.stop()
+
+    def __call__(self, progress: Progress) -> None:
+        self.live.update(
+            Text(
+                f"{progress.stage.replace('_', ' ')} : "
+                f"{progress.iterations:,} iterations in {progress.elapsed:.1f}s "
+                f"({progress.rate:,.0f}/s), current candidate {progress.candidate}"
+            )
+        )
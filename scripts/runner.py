@@ -0,0 +1,195 @@
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from scripts.cache import ResultCache
+from scripts.history import HistoryStore
+from scripts.utils import DataType, Engine, get_puzzle_solver_class
+
+
+@dataclass
+class DayRun:
+    day: int
+    results: tuple[Any, Any] | None = None
+    duration: float = 0.0
+    error: str | None = None
+    cached: bool = False
+    data_hash: str | None = None
+
+
+def run_day(day: int, data_type: DataType, use_cache: bool = True) -> DayRun:
+    """Solve the puzzle of the given day and measure its wall time.
+    Top-level function so it can be sent to a process pool."""
+    start_time = time.perf_counter()
+    try:
+        puzzle_solver = get_puzzle_solver_class(day)(day=day, data_type=data_type)
+        # Days are already solved in parallel
+        puzzle_solver.parallel_parts = False
+        puzzle_solver.nb_workers = 1
+        result_cache = ResultCache()
+        if use_cache and (results := result_cache.get(puzzle_solver)) is not None:
+            return DayRun(
+                day=day,
+                results=results,
+                duration=time.perf_counter() - start_time,
+                cached=True,
+                data_hash=puzzle_solver.data_hash,
+            )
+
+        results = puzzle_solver.solve()
+        result_cache.set(puzzle_solver, results)
+    except ModuleNotFoundError:
+        return DayRun(day=day, error="No puzzle solver")
+    except FileNotFoundError:
+        return DayRun(day=day, error=f"No {data_type.value}.txt file")
+    except Exception as error:
+        return DayRun(
+            day=day,
+            duration=time.perf_counter() - start_time,
+            error=f"{type(error).__name__}: {error}",
+        )
+
+    return DayRun(
+        day=day,
+        results=results,
+        duration=time.perf_counter() - start_time,
+        data_hash=puzzle_solver.data_hash,
+    )
+
+
+@dataclass
+class InputRun:
+    data_file: Path
+    results: tuple[Any, Any] | None = None
+    duration: float = 0.0
+    error: str | None = None
+    cached: bool = False
+
+    def to_dict(self) -> dict[str, Any]:
+        input_run = {"file": str(self.data_file)}
+        if self.error is not None:
+            return {**input_run, "error": self.error}
+        return {
+            **input_run,
+            "results": list(self.results),
+            "duration": self.duration,
+            "cached": self.cached,
+        }
+
+
+def init_input_worker(day: int, engine: Engine) -> None:
+    """Worker initializer, importing the day module (and compiling its
+    patterns) once per worker instead of once per input"""
+    # Loading messages mustn't be mixed with the results of the runs
+    sys.stdout = sys.stderr
+    get_puzzle_solver_class(day, engine)
+
+
+def run_input(
+    day: int,
+    engine: Engine,
+    data_file: Path,
+    use_cache: bool = True,
+    parameters: dict[str, Any] | None = None,
+) -> InputRun:
+    """Solve the puzzle of the given day for a given data file.
+    Top-level function so it can be sent to a process pool."""
+    start_time = time.perf_counter()
+    try:
+        puzzle_solver = get_puzzle_solver_class(day, engine)(
+            day=day, data_type=DataType.INPUT, data_file=data_file
+        )
+        # Inputs are already solved in parallel
+        puzzle_solver.parallel_parts = False
+        puzzle_solver.nb_workers = 1
+        puzzle_solver.set_parameters(parameters or {})
+
+        result_cache = ResultCache()
+        if use_cache and (results := result_cache.get(puzzle_solver)) is not None:
+            return InputRun(
+                data_file=data_file,
+                results=results,
+                duration=time.perf_counter() - start_time,
+                cached=True,
+            )
+
+        results = puzzle_solver.solve()
+        result_cache.set(puzzle_solver, results)
+    except Exception as error:
+        return InputRun(
+            data_file=data_file,
+            duration=time.perf_counter() - start_time,
+            error=f"{type(error).__name__}: {error}",
+        )
+
+    return InputRun(
+        data_file=data_file,
+        results=results,
+        duration=time.perf_counter() - start_time,
+    )
+
+
+def run_inputs(
+    day: int,
+    engine: Engine,
+    data_files: Iterable[Path],
+    max_workers: int | None = None,
+    use_cache: bool = True,
+    parameters: dict[str, Any] | None = None,
+) -> Iterator[InputRun]:
+    """Solve the puzzle of the given day for each data file on a process
+    pool, biggest files being submitted first. Runs are yielded as they
+    finish."""
+    ordered_data_files = sorted(
+        data_files, key=lambda data_file: data_file.stat().st_size, reverse=True
+    )
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers or os.cpu_count(),
+        initializer=init_input_worker,
+        initargs=(day, engine),
+    ) as executor:
+        futures = [
+            executor.submit(run_input, day, engine, data_file, use_cache, parameters)
+            for data_file in ordered_data_files
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def run_days(
+    days: Iterable[int],
+    data_type: DataType,
+    max_workers: int | None = None,
+    use_cache: bool = True,
+) -> Iterator[DayRun]:
+    """Solve the given days on a process pool, slowest ones (judged from
+    the performance history) being submitted first. Runs are yielded as
+    they finish."""
+    with HistoryStore() as history:
+        ordered_days = sorted(
+            days,
+            key=lambda day: history.get_expected_duration(day, data_type),
+            reverse=True,
+        )
+
+        with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            futures = [
+                executor.submit(run_day, day, data_type, use_cache)
+                for day in ordered_days
+            ]
+            for future in as_completed(futures):
+                day_run = future.result()
+                if day_run.error is None and not day_run.cached:
+                    history.add_run(
+                        day=day_run.day,
+                        engine=Engine.REFERENCE,
+                        data_type=data_type,
+                        data_hash=day_run.data_hash,
+                        duration=day_run.duration,
+                    )
+                yield day_run
@@ -0,0 +1,102 @@
+import importlib
+import math
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from random import Random
+from tempfile import TemporaryDirectory
+from types import ModuleType
+
+from scripts.utils import DataType, get_puzzle_solver_class
+
+
+def get_generator_module(day: int) -> ModuleType:
+    """Load the input generator of the day. Raises ModuleNotFoundError
+    if there is no generator for this day."""
+    return importlib.import_module(f"days.day{day:02d}.generator")
+
+
+def write_generated_input(day: int, size: int, output_file: Path, seed: int) -> None:
+    generator_module = get_generator_module(day)
+    with output_file.open("w", encoding="utf-8") as file:
+        file.writelines(generator_module.generate(size, Random(seed)))
+
+
+@dataclass
+class GrowthCurve:
+    model: str  # "polynomial" or "exponential"
+    factor: float  # exponent for polynomial, base for exponential
+    r_squared: float
+
+    def __str__(self) -> str:
+        if self.model == "polynomial":
+            return f"O(n^{self.factor:.2f})"
+        return f"O({self.factor:.2f}^n)"
+
+
+def fit_line(xs: list[float], ys: list[float]) -> tuple[float, float]:
+    """Least squares fit of y = slope * x + intercept, returns the
+    slope and the coefficient of determination"""
+    mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    variance_x = sum((x - mean_x) ** 2 for x in xs)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    slope = covariance / variance_x
+    intercept = mean_y - slope * mean_x
+
+    total_error = sum((y - mean_y) ** 2 for y in ys)
+    residual_error = sum((y - (slope * x + intercept)) ** 2 for x, y in zip(xs, ys))
+    r_squared = 1 - residual_error / total_error if total_error else 1.0
+    return slope, r_squared
+
+
+def fit_growth_curve(sizes: list[int], timings: list[float]) -> GrowthCurve | None:
+    """Fit timings against both a polynomial (log-log linear) and an
+    exponential (log-linear) model, and keep the one fitting the best"""
+    if len(set(sizes)) < 2:
+        return None
+
+    log_timings = [math.log(timing) for timing in timings]
+    exponent, polynomial_r_squared = fit_line(
+        [math.log(size) for size in sizes], log_timings
+    )
+    log_base, exponential_r_squared = fit_line(
+        [float(size) for size in sizes], log_timings
+    )
+
+    if polynomial_r_squared >= exponential_r_squared:
+        return GrowthCurve("polynomial", exponent, polynomial_r_squared)
+    return GrowthCurve("exponential", math.exp(log_base), exponential_r_squared)
+
+
+@dataclass
+class ScaleRun:
+    size: int
+    duration: float
+    results: tuple
+
+
+def scale_day(day: int, sizes: list[int] | None, seed: int) -> list[ScaleRun]:
+    """Solve generated inputs of increasing sizes, in the same process"""
+    puzzle_solver_class = get_puzzle_solver_class(day)
+    sizes = sizes or get_generator_module(day).SIZES
+
+    scale_runs = []
+    with TemporaryDirectory() as temporary_directory:
+        for size in sorted(sizes):
+            data_file = Path(temporary_directory) / f"day{day:02d}_{size}.txt"
+            write_generated_input(day, size, data_file, seed)
+
+            puzzle_solver = puzzle_solver_class(
+                day=day, data_type=DataType.INPUT, data_file=data_file
+            )
+            start_time = time.perf_counter()
+            results = puzzle_solver.solve()
+            scale_runs.append(
+                ScaleRun(
+                    size=size,
+                    duration=time.perf_counter() - start_time,
+                    results=results,
+                )
+            )
+
+    return scale_runs
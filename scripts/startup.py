@@ -0,0 +1,33 @@
+import subprocess
+import sys
+from collections import defaultdict
+
+from scripts.utils import ROOT_PATH
+
+
+def get_import_times(module: str = "aoc") -> dict[str, int]:
+    """Import the module in a fresh interpreter with -X importtime, and
+    return the import time (in µs) spent in each top-level package"""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT_PATH,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    import_times: dict[str, int] = defaultdict(int)
+    for line in process.stderr.splitlines():
+        # Lines format : "import time: <self> | <cumulative> | <package>"
+        if not line.startswith("import time:"):
+            continue
+
+        self_time, _, package = line.removeprefix("import time:").split("|")
+        if not self_time.strip().isdigit():
+            continue  # Header line
+
+        # Self times are summed for each top-level package, so nested
+        # imports aren't counted twice
+        import_times[package.strip().split(".")[0]] += int(self_time)
+
+    return dict(sorted(import_times.items(), key=lambda item: item[1], reverse=True))
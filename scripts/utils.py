@@ -1,49 +1,322 @@
+import importlib
+import inspect
+import mmap
 import os
+import sys
+import time
+import weakref
 from abc import ABC, abstractmethod
+from contextlib import AbstractContextManager, ExitStack, contextmanager
+from dataclasses import dataclass
 from enum import Enum, auto
-from functools import cached_property
+from functools import cache, cached_property, lru_cache, partial
+from hashlib import sha256
 from pathlib import Path
-from typing import Any
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Callable, Iterator
 
-import httpx
 from rich import print
 
+if TYPE_CHECKING:
+    import httpx
+
+    from scripts.checkpoints import CheckpointStore
+
+ROOT_PATH = Path(__file__).parent.parent
+DAYS_PATH = ROOT_PATH / "days"
+CACHE_PATH = ROOT_PATH / ".cache"
+DAEMON_SOCKET_PATH = CACHE_PATH / "aoc.sock"
+
+AOC_DEFAULT_BASE_URL = "https://adventofcode.com/2015"
+AOC_TIMEOUT = 30.0
+
 
 class DataType(str, Enum):
     EXAMPLE = "example"
     INPUT = "input"
 
 
+class Engine(str, Enum):
+    """Implementations a day can provide. The reference engine is the
+    readable one in main.py, other engines are optimized subclasses of
+    it, each in the module of the same name (ex: fast.py)."""
+
+    REFERENCE = "reference"
+    FAST = "fast"
+
+    @property
+    def module_name(self) -> str:
+        return "main" if self == Engine.REFERENCE else self.value
+
+
+StageHook = Callable[[str], AbstractContextManager]
+
+
+@dataclass
+class Progress:
+    stage: str
+    iterations: int
+    candidate: Any  # Value currently examined by the solver
+    elapsed: float  # seconds since the start of the stage
+
+    @property
+    def rate(self) -> float:
+        """Iterations per second"""
+        return self.iterations / self.elapsed if self.elapsed else 0.0
+
+
+ProgressHook = Callable[[Progress], None]
+
+
+class SolverTimeoutError(TimeoutError):
+    """Raised by a puzzle solver when its time budget is exceeded"""
+
+
 class AbstractPuzzleSolver(ABC):
     day: int
     data_type: DataType
-    lines: list[str]
+    data_file: Path
+    raw: memoryview
+    engine: Engine = Engine.REFERENCE
+    is_parsed: bool = False
+    parallel_parts: bool = False  # Solve parts in separate processes
+    nb_workers: int | None = None  # Processes of parallel searches, CPU count if None
+    stages: tuple[str, str, str] = ("parse", "first_part", "second_part")
+    stage_hooks: list[StageHook]
+    progress_hooks: list[ProgressHook]
+    progress_interval: int = 10_000  # Iterations between progress reports
+    deadline: float | None = None  # perf_counter() value, no time budget if None
+    checkpoint_store: "CheckpointStore | None" = None
+    current_search: str = ""
+    # Attributes which can be set to change the puzzle (ex: its difficulty)
+    parameters: tuple[str, ...] = ()
 
-    def __init__(self, day: int, data_type: DataType):
+    def __init__(self, day: int, data_type: DataType, data_file: Path | None = None):
         self.day = day
         self.data_type = data_type
+        # Data file of the day is used, unless another one is specified
+        self.data_file = data_file or (
+            DAYS_PATH / f"day{self.day:02d}" / f"{self.data_type.value}.txt"
+        )
+        self.stage_hooks = []
+        self.progress_hooks = []
         self.__get_puzzle_data()
 
+    @cached_property
+    def text(self) -> str:
+        return str(self.raw, "utf-8")
+
+    @cached_property
+    def lines(self) -> list[str]:
+        lines = self.text.replace("\r\n", "\n").split("\n")
+        # A trailing newline doesn't start a new line
+        if lines[-1] == "":
+            lines.pop()
+        return lines
+
     @cached_property
     def line(self):
-        return self.lines[0]
-
-    def __get_puzzle_data(self) -> list[str]:
-        data_file = (
-            Path(__file__).parent.parent
-            / "days"
-            / f"day{self.day:02d}"
-            / f"{self.data_type.value}.txt"
-        )
-        print(f"Loading {data_file}...")
-        if not data_file.exists():
+        return next(self.iter_lines())
+
+    def iter_lines(self) -> Iterator[str]:
+        """Lazily decode lines of puzzle data, without building the whole list"""
+        start = 0
+        while start < len(self.__buffer):
+            end = self.__buffer.find(b"\n", start)
+            if end == -1:
+                end = len(self.__buffer)
+            yield str(self.raw[start:end], "utf-8").removesuffix("\r")
+            start = end + 1
+
+    @cached_property
+    def data_hash(self) -> str:
+        return sha256(self.raw).hexdigest()
+
+    def set_parameters(self, values: dict[str, Any]) -> None:
+        for parameter, value in values.items():
+            if parameter not in self.parameters:
+                raise ValueError(f"Day {self.day} has no {parameter} parameter")
+            setattr(self, parameter, value)
+
+    def get_parameters(self) -> dict[str, Any]:
+        """Values of the parameters of the solver, results depend on them"""
+        return {parameter: getattr(self, parameter) for parameter in self.parameters}
+
+    @classmethod
+    def get_source_hash(cls) -> str:
+        """Hash of the source of the solver, including the reference engine
+        other engines are built upon, the project modules they use (ex: the
+        parsing layer) and the data files of the day which aren't puzzle
+        data (ex: the shop of day 21)"""
+        source_files: set[Path] = set()
+        for solver_class in cls.__mro__:
+            if issubclass(solver_class, AbstractPuzzleSolver) and (
+                solver_class is not AbstractPuzzleSolver
+            ):
+                source_files |= get_project_source_files(
+                    sys.modules[solver_class.__module__]
+                )
+                source_files |= {
+                    data_file.resolve()
+                    for data_file in Path(
+                        inspect.getsourcefile(solver_class)
+                    ).parent.glob("*.txt")
+                    if data_file.stem not in {data_type.value for data_type in DataType}
+                }
+
+        source_hash = sha256()
+        for source_file in sorted(source_files):
+            source_hash.update(
+                source_file.relative_to(ROOT_PATH.resolve()).as_posix().encode()
+            )
+            source_hash.update(source_file.read_bytes())
+        return source_hash.hexdigest()
+
+    def __get_puzzle_data(self) -> None:
+        print(f"Loading {self.data_file}...")
+        if not self.data_file.exists():
             raise FileNotFoundError
 
-        with data_file.open() as file:
-            self.lines = [line.rstrip("\n") for line in file]
+        self.__map_data_file()
+
+    def __map_data_file(self) -> None:
+        """Map the data file in memory, lines are only decoded when needed"""
+        with self.data_file.open("rb") as file:
+            # Empty files can't be mapped in memory
+            if os.fstat(file.fileno()).st_size == 0:
+                self.__buffer = b""
+            else:
+                self.__buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.raw = memoryview(self.__buffer)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Memory maps can't be pickled, the file is mapped again when unpickling
+        state = self.__dict__.copy()
+        del state["raw"], state["_AbstractPuzzleSolver__buffer"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.__map_data_file()
+
+    def parse(self, force: bool = False) -> None:
+        """Compute data shared by both parts, only once unless forced"""
+        if self.is_parsed and not force:
+            return
+
+        with self.run_stage("parse"):
+            self._parse()
+        self.is_parsed = True
+
+        # Searches can run while parsing too, they're over
+        if self.checkpoint_store is not None:
+            self.checkpoint_store.clear(self, "parse")
+
+    def _parse(self) -> None:
+        """Override to compute data shared by both parts"""
+
+    def add_stage_hook(self, stage_hook: StageHook) -> None:
+        """Register a context manager factory, entered around each stage
+        (parse, first_part and second_part) with the stage name"""
+        self.stage_hooks.append(stage_hook)
+
+    def add_progress_hook(self, progress_hook: ProgressHook) -> None:
+        """Register a callable, called with the progress of long-running
+        searches each time they report it"""
+        self.progress_hooks.append(progress_hook)
+
+    def set_time_budget(self, seconds: float) -> None:
+        """Searches reporting their progress will raise SolverTimeoutError
+        once the budget is exceeded"""
+        self.deadline = time.perf_counter() + seconds
+
+    def resume_search(self, default: Any, search: str = "") -> Any:
+        """Called by long-running searches before starting, returns the
+        position saved in the last checkpoint of this search if resuming,
+        or the default one. Several searches of the same stage must be
+        named differently."""
+        self.current_search = search
+        if self.checkpoint_store is None:
+            return default
+
+        position = self.checkpoint_store.load(self, self.current_stage, search)
+        return default if position is None else position
+
+    def report_progress(self, iterations: int, candidate: Any) -> None:
+        """Called by long-running searches every progress_interval iterations,
+        so the time budget can be checked and the progress displayed. The
+        candidate is saved in checkpoints, the search must be able to resume
+        from it (see resume_search)."""
+        now = time.perf_counter()
+        is_timed_out = self.deadline is not None and now > self.deadline
+        if self.checkpoint_store is not None:
+            self.checkpoint_store.save(
+                self,
+                stage=self.current_stage,
+                search=self.current_search,
+                iterations=iterations,
+                position=candidate,
+                force=is_timed_out,
+            )
+
+        if is_timed_out:
+            raise SolverTimeoutError(
+                f"Time budget exceeded during {self.current_stage} after "
+                f"{iterations} iterations (candidate: {candidate})"
+            )
+        if not self.progress_hooks:
+            return
+
+        progress = Progress(
+            stage=self.current_stage,
+            iterations=iterations,
+            candidate=candidate,
+            elapsed=now - self.stage_start_time,
+        )
+        for progress_hook in self.progress_hooks:
+            progress_hook(progress)
+
+    @contextmanager
+    def run_stage(self, stage: str) -> Iterator[None]:
+        if self.deadline is not None and time.perf_counter() > self.deadline:
+            raise SolverTimeoutError(f"Time budget exceeded before {stage}")
+
+        self.current_stage = stage
+        self.stage_start_time = time.perf_counter()
+        with ExitStack() as stack:
+            for stage_hook in self.stage_hooks:
+                stack.enter_context(stage_hook(stage))
+            yield
 
     def solve(self) -> tuple[int, int]:
-        return self._solve_first_part(), self._solve_second_part()
+        # Parsed once, child processes get the parsed data with the solver
+        self.parse()
+        if self.parallel_parts:
+            return self.__solve_parts_in_processes()
+
+        return self.solve_part(1), self.solve_part(2)
+
+    def solve_part(self, part: int) -> int:
+        self.parse()
+        with self.run_stage(self.stages[part]):
+            result = (
+                self._solve_first_part() if part == 1 else self._solve_second_part()
+            )
+
+        # Search is over, there is nothing left to resume
+        if self.checkpoint_store is not None:
+            self.checkpoint_store.clear(self, self.stages[part])
+        return result
+
+    def __solve_parts_in_processes(self) -> tuple[int, int]:
+        """Each process works on its own copy of the solver, so state stored
+        on self by one part can't interfere with the other one"""
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            first_part = executor.submit(self.solve_part, 1)
+            second_part = executor.submit(self.solve_part, 2)
+            return first_part.result(), second_part.result()
 
     @abstractmethod
     def _solve_first_part(self) -> int: ...
@@ -52,6 +325,57 @@ class AbstractPuzzleSolver(ABC):
     def _solve_second_part(self) -> int: ...
 
 
+def get_project_source_files(
+    module: ModuleType, source_files: set[Path] | None = None
+) -> set[Path]:
+    """Source file of a module, and of the project modules it uses,
+    directly or through other project modules"""
+    source_files = set() if source_files is None else source_files
+    source_file = Path(inspect.getsourcefile(module)).resolve()
+    if source_file in source_files:
+        return source_files
+    source_files.add(source_file)
+
+    for value in vars(module).values():
+        used_module = (
+            value
+            if isinstance(value, ModuleType)
+            else sys.modules.get(getattr(value, "__module__", None) or "")
+        )
+        used_file = getattr(used_module, "__file__", None)
+        if used_file is not None and any(
+            Path(used_file).resolve().is_relative_to(source_path)
+            for source_path in (DAYS_PATH.resolve(), (ROOT_PATH / "scripts").resolve())
+        ):
+            get_project_source_files(used_module, source_files)
+    return source_files
+
+
+def get_available_days() -> list[int]:
+    return sorted(
+        int(day_path.name[3:])
+        for day_path in DAYS_PATH.glob("day*/")
+        if (day_path / "main.py").exists()
+    )
+
+
+def get_puzzle_solver_class(
+    day: int, engine: Engine = Engine.REFERENCE
+) -> type[AbstractPuzzleSolver]:
+    """Load the module of the day and return its puzzle solver class.
+    Raises ModuleNotFoundError if there is no solution for this day yet,
+    or if the day doesn't provide this engine."""
+    day_module = importlib.import_module(f"days.day{day:02d}.{engine.module_name}")
+    return day_module.PuzzleSolver
+
+
+def get_available_engines(day: int) -> list[Engine]:
+    day_path = DAYS_PATH / f"day{day:02d}"
+    return [
+        engine for engine in Engine if (day_path / f"{engine.module_name}.py").exists()
+    ]
+
+
 class Multiton(ABC):
     _instances = {}
 
@@ -61,6 +385,99 @@ class Multiton(ABC):
         return cls._instances[key]
 
 
+@dataclass
+class CacheStatistics:
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        calls = self.hits + self.misses
+        return self.hits / calls if calls else 0.0
+
+
+class memoize:
+    """Memoize an instance method. Unlike functools.cache, results are
+    stored on the instance (and released with it) instead of being keyed
+    on self, and the cache can be limited to the maxsize most recently used
+    results.
+
+    The bound method is a functools.lru_cache wrapper, exposing cache_clear()
+    for explicit invalidation and cache_info() for the instance statistics.
+    Statistics of all instances are gathered by get_memoize_statistics()."""
+
+    # Every memoized method, by qualified name
+    methods: dict[str, "memoize"] = {}
+
+    def __init__(self, func: Callable | None = None, *, maxsize: int | None = None):
+        self.func = func
+        self.maxsize = maxsize
+        self.retired_statistics = CacheStatistics()
+        self.bound_methods: set[Callable] = set()
+
+    def __call__(self, func: Callable) -> "memoize":
+        # Used with arguments, as @memoize(maxsize=...)
+        return type(self)(func, maxsize=self.maxsize)
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        # Name is already mangled for private methods
+        self.name = name
+        self.methods[self.func.__qualname__] = self
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Callable:
+        if instance is None:
+            return self
+
+        # Cached results only hold a weak reference to the instance, so
+        # they don't keep it alive. As the bound method is stored in the
+        # instance dict, next lookups won't go through this descriptor.
+        bound_method = lru_cache(maxsize=self.maxsize)(
+            partial(self.func, weakref.proxy(instance))
+        )
+        instance.__dict__[self.name] = bound_method
+        self.bound_methods.add(bound_method)
+        weakref.finalize(instance, self.__retire, bound_method)
+        return bound_method
+
+    def __retire(self, bound_method: Callable) -> None:
+        cache_info = bound_method.cache_info()
+        self.retired_statistics.hits += cache_info.hits
+        self.retired_statistics.misses += cache_info.misses
+        self.bound_methods.discard(bound_method)
+
+    @property
+    def statistics(self) -> CacheStatistics:
+        statistics = CacheStatistics(
+            hits=self.retired_statistics.hits,
+            misses=self.retired_statistics.misses,
+        )
+        for bound_method in self.bound_methods:
+            cache_info = bound_method.cache_info()
+            statistics.hits += cache_info.hits
+            statistics.misses += cache_info.misses
+        return statistics
+
+    def reset_statistics(self) -> None:
+        self.retired_statistics = CacheStatistics()
+        for bound_method in self.bound_methods:
+            # Statistics of lru_cache can only be reset with the cache
+            bound_method.cache_clear()
+
+
+def get_memoize_statistics() -> dict[str, CacheStatistics]:
+    """Statistics of memoized methods called at least once"""
+    return {
+        name: statistics
+        for name, method in memoize.methods.items()
+        if (statistics := method.statistics).hits or statistics.misses
+    }
+
+
+def reset_memoize_statistics() -> None:
+    for method in memoize.methods.values():
+        method.reset_statistics()
+
+
 def min_and_max(first: Any, second: Any) -> tuple[Any, Any]:
     return min(first, second), max(first, second)
 
@@ -73,22 +490,100 @@ def create_empty_file(file_path: Path) -> None:
         print(f"[rouge]File [bold]{file_path.name}[/bold] already exists.[/rouge]")
 
 
+def get_base_url() -> str:
+    return os.getenv("AOC_BASE_URL") or AOC_DEFAULT_BASE_URL
+
+
+@cache
+def get_http_client(session_id: str) -> "httpx.Client":
+    """Shared client, so connections to AoC are pooled between calls"""
+    import httpx
+
+    return httpx.Client(
+        base_url=get_base_url(),
+        cookies={"session": session_id},
+        timeout=AOC_TIMEOUT,
+    )
+
+
+def get_input_cache_file(session_id: str, day: int) -> Path:
+    # Inputs are different for each user, so they're cached by session
+    session_hash = sha256(session_id.encode()).hexdigest()[:16]
+    return CACHE_PATH / "inputs" / session_hash / f"day{day:02d}.txt"
+
+
 def get_input(day: int) -> str | None:
     if not (session_id := os.getenv("AOC_SESSION_ID")):
         print("[rouge]No session ID found, input can't be retrieved from AoC[/rouge]")
         return
 
-    input_url = f"{os.getenv('AOC_BASE_URL')}/day/{day}/input"
+    cache_file = get_input_cache_file(session_id, day)
+    if cache_file.exists():
+        print("[green]Input data retrieved from cache ![/green]")
+        return cache_file.read_text(encoding="utf-8")
+
     print("Retrieving input data from AoC...")
-    response = httpx.get(input_url, cookies={"session": session_id})
-    if response.status_code != httpx.codes.OK:
+    response = get_http_client(session_id).get(f"/day/{day}/input")
+    if not response.is_success:
         print(f"[red]Error from AoC when retrieving input : {response}[/red]")
         return
 
     print("[green]Input data retrieved from AoC ![/green]")
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    cache_file.write_text(response.text, encoding="utf-8")
     return response.text
 
 
+def fetch_inputs(days: list[int], max_connections: int = 8) -> dict[int, str | None]:
+    """Retrieve inputs of several days concurrently, using the cache when possible.
+    Inputs which couldn't be retrieved are None in returned dict."""
+    if not (session_id := os.getenv("AOC_SESSION_ID")):
+        print("[rouge]No session ID found, input can't be retrieved from AoC[/rouge]")
+        return {day: None for day in days}
+
+    import asyncio
+
+    import httpx
+
+    inputs = {
+        day: cache_file.read_text(encoding="utf-8")
+        for day in days
+        if (cache_file := get_input_cache_file(session_id, day)).exists()
+    }
+
+    async def fetch_input(client: httpx.AsyncClient, day: int) -> None:
+        try:
+            response = await client.get(f"/day/{day}/input")
+        except httpx.HTTPError as error:
+            print(f"[red]Error when retrieving day {day} from AoC : {error!r}[/red]")
+            inputs[day] = None
+            return
+        if not response.is_success:
+            print(f"[red]Error from AoC when retrieving day {day} : {response}[/red]")
+            inputs[day] = None
+            return
+
+        cache_file = get_input_cache_file(session_id, day)
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(response.text, encoding="utf-8")
+        inputs[day] = response.text
+
+    async def fetch_missing_inputs() -> None:
+        async with httpx.AsyncClient(
+            base_url=get_base_url(),
+            cookies={"session": session_id},
+            timeout=AOC_TIMEOUT,
+            limits=httpx.Limits(max_connections=max_connections),
+        ) as client:
+            await asyncio.gather(
+                *(fetch_input(client, day) for day in days if day not in inputs)
+            )
+
+    print(f"Retrieving {len(days) - len(inputs)} input(s) from AoC...")
+    asyncio.run(fetch_missing_inputs())
+    return {day: inputs[day] for day in days}
+
+
 class AnswerResult(Enum):
     ALREADY_SOLVED = auto()
     RIGHT_ANSWER = auto()
@@ -101,13 +596,11 @@ def submit_answer(day: int, task: int, answer: int) -> AnswerResult | None:
         return
 
     print(f"Submitting answer for task {task} to AoC...")
-    submit_url = f"{os.getenv('AOC_BASE_URL')}/day/{day}/answer"
-    response = httpx.post(
-        submit_url,
-        cookies={"session": session_id},
+    response = get_http_client(session_id).post(
+        f"/day/{day}/answer",
         data={"level": task, "answer": str(answer)},
     )
-    if response.status_code != httpx.codes.OK:
+    if not response.is_success:
         print(f"[red]Error from AoC when submitting solution : {response}[/red]")
         return
 
@@ -0,0 +1,74 @@
+from dataclasses import dataclass, field
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any
+
+from scripts.scaling import get_generator_module, write_generated_input
+from scripts.utils import (
+    DAYS_PATH,
+    DataType,
+    Engine,
+    get_available_engines,
+    get_puzzle_solver_class,
+)
+
+
+@dataclass
+class Verification:
+    day: int
+    data_name: str
+    # Results (or error) of each engine
+    results: dict[Engine, tuple[Any, Any] | str] = field(default_factory=dict)
+
+    @property
+    def is_consistent(self) -> bool:
+        return len({repr(results) for results in self.results.values()}) == 1
+
+
+def solve_with_engine(
+    day: int, engine: Engine, data_type: DataType, data_file: Path
+) -> tuple[Any, Any] | str:
+    try:
+        puzzle_solver = get_puzzle_solver_class(day, engine)(
+            day=day, data_type=data_type, data_file=data_file
+        )
+        return puzzle_solver.solve()
+    except Exception as error:
+        return f"{type(error).__name__}: {error}"
+
+
+def verify_day(day: int, seeds: int, size: int | None = None) -> list[Verification]:
+    """Solve example, input and generated data with every engine of the day.
+    Generated inputs have the smallest size of the generator by default, as
+    the reference engine has to solve them too."""
+    engines = get_available_engines(day)
+
+    with TemporaryDirectory() as temporary_directory:
+        data_files: list[tuple[str, DataType, Path]] = [
+            (data_type.value, data_type, data_file)
+            for data_type in DataType
+            if (
+                data_file := DAYS_PATH / f"day{day:02d}" / f"{data_type.value}.txt"
+            ).exists()
+        ]
+
+        try:
+            generator_size = size or min(get_generator_module(day).SIZES)
+        except ModuleNotFoundError:
+            seeds = 0
+        for seed in range(seeds):
+            data_file = Path(temporary_directory) / f"generated_{seed}.txt"
+            write_generated_input(day, generator_size, data_file, seed)
+            data_files.append((f"generated (seed {seed})", DataType.INPUT, data_file))
+
+        return [
+            Verification(
+                day=day,
+                data_name=data_name,
+                results={
+                    engine: solve_with_engine(day, engine, data_type, data_file)
+                    for engine in engines
+                },
+            )
+            for data_name, data_type, data_file in data_files
+        ]